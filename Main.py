@@ -1,21 +1,18 @@
 import argparse
 from projects import ProjectName, Project
-from data_extractor import DataExtractor
 from version_selector import VersionType
 from config import Config
 import os
 import json
 from pathlib import Path
-import pandas as pd
-from metrics.version_metrics import Extractor
-from metrics.version_metrics_data import DataBuilder
 from metrics.version_metrics_name import DataNameEnum
-from classification_instance import ClassificationInstance
 from itertools import tee
 import time
 from functools import reduce
 import traceback
-from issues import JiraIssue, BZIssue, Issue
+import tracing
+from tracing import span
+# modules that pull pandas, sklearn or GitPython are imported where they are used, so listing projects stays fast
 
 
 class Main():
@@ -26,6 +23,8 @@ class Main():
         self.jira_url = None
         self.github_user_name = None
         self.quick_mode = False
+        self.workers = int(Config().config['VERSION_METRICS'].get('Workers', '1'))
+        self.snapshots = Config().config['VERSION_METRICS'].get('Checkout', 'checkout') == 'snapshot'
 
     def list_projects(self):
         print("\n".join(list(map(lambda e: "{0}: {1}".format(e.name, e.value.description), ProjectName))))
@@ -42,6 +41,7 @@ class Main():
         self.set_extractor()
 
     def set_extractor(self):
+        from data_extractor import DataExtractor
         self.extractor = DataExtractor(self.project, self.quick_mode)
 
     def extract_metrics(self, rest_versions, rest_only, data_types, predict=True):
@@ -52,22 +52,25 @@ class Main():
         rest_aggregated_classes_datasets = []
         rest_methods_datasets = []
         selected_versions = self.extractor.get_selected_versions()[:-1]
+        jobs = []
         if not rest_only:
-            for version in selected_versions:
-                classes_df, methods_df, aggregated_classes_df = self.extract_features_to_version(version, True, data_types)
+            jobs.extend(map(lambda version: (version, True), selected_versions))
+        jobs.extend(map(lambda version: (version, False), filter(lambda version: version not in selected_versions, rest_versions)))
+        for (version, extract_bugs), (dfs, error) in zip(jobs, self.extract_versions(jobs, data_types)):
+            if error is not None:
+                if extract_bugs:
+                    raise error
+                traceback.print_exception(type(error), error, error.__traceback__)
+                continue
+            classes_df, methods_df, aggregated_classes_df = dfs
+            if extract_bugs:
                 classes_datasets.append(classes_df)
                 methods_datasets.append(methods_df)
                 aggregated_classes_datasets.append(aggregated_classes_df)
-        for version in rest_versions:
-            if version in selected_versions:
-                continue
-            try:
-                classes_df, methods_df, aggregated_classes_df = self.extract_features_to_version(version, False, data_types)
+            else:
                 rest_classes_datasets.append((version, classes_df))
                 rest_methods_datasets.append((version, methods_df))
                 rest_aggregated_classes_datasets.append((version, aggregated_classes_df))
-            except:
-                traceback.print_exc()
         if rest_only:
             return
         try:
@@ -96,7 +99,58 @@ class Main():
             except:
                 traceback.print_exc()
 
+    def extract_versions(self, jobs, data_types):
+        """
+        yields ((classes_df, methods_df, aggregated_classes_df), None) or (None, exception) for every (version, extract_bugs)
+        of jobs, in order. with more than one worker the versions are extracted at the same time in their own worktrees,
+        one process per worktree, otherwise they are checked out one by one in the clone of the project.
+        with snapshots the worktrees are snapshots of the java files of the versions.
+        """
+        workers = min(self.workers, len(jobs))
+        if workers <= 1:
+            for version, extract_bugs in jobs:
+                try:
+                    yield self.extract_features_to_version(version, extract_bugs, data_types), None
+                except Exception as e:
+                    yield None, e
+            return
+        from concurrent.futures import ProcessPoolExecutor, FIRST_COMPLETED, wait
+        from worktrees import WorktreePool
+        from caching import MEMORY_CACHE, memory_limit
+        # every process has its own memory tier of the cache, together they keep to MemoryLimitMB
+        MEMORY_CACHE.resize(memory_limit(workers))
+        if any(map(lambda job: job[1], jobs)):
+            # the data types a serial run leaves after its first version with bugs
+            self.add_bugged_data_types(data_types)
+        pool = WorktreePool(self.project, workers, snapshots=self.snapshots).create()
+        free = list(pool.paths)
+        queue = list(enumerate(jobs))
+        pending = {}
+        results = {}
+        next_job = 0
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            while queue or pending:
+                while queue and free:
+                    ind, (version, extract_bugs) = queue.pop(0)
+                    path = free.pop()
+                    future = executor.submit(extract_version_in_worktree, self.project, self.quick_mode, version,
+                                             extract_bugs, set(data_types), pool, path, memory_limit(workers))
+                    pending[future] = (ind, path)
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    ind, path = pending.pop(future)
+                    free.append(path)
+                    try:
+                        results[ind] = (future.result(), None)
+                    except Exception as e:
+                        results[ind] = (None, e)
+                while next_job in results:
+                    yield results.pop(next_job)
+                    next_job += 1
+
     def create_all_but_one_dataset(self, data_types):
+        import pandas as pd
+        from classification_instance import ClassificationInstance
         alls = {}
         ones = {}
         detailed = {}
@@ -144,6 +198,7 @@ class Main():
 
     def create_sub_data_set_by_columns(self, columns, dataset_cols, dir_name, label, names, sub_dir, testing_df,
                                        training_df):
+        from classification_instance import ClassificationInstance
         scores = []
         for d in columns:
             cols = set(filter(lambda dc: any(map(lambda c: c in dc, columns[d])), dataset_cols))
@@ -182,6 +237,8 @@ class Main():
         return classes_data, method_data, classes_intermediate_dir, methods_intermediate_dir, intermediate_dir
 
     def aggrate_methods_df(self, df):
+        import pandas as pd
+
         def clean(s):
             if "@" in s:
                 return s[1].split('@')[1].split('.')[:-1][-1]
@@ -221,9 +278,23 @@ class Main():
                 df[col].fillna(default, inplace=True)
         return df.dropna(axis=1)
 
-    def extract_features_to_version(self, version, extract_bugs, data_types):
-        self.extractor.checkout_version(version)
-        db, extractors_to_run = self.get_extractors(data_types, extract_bugs, version)
+    def extract_features_to_version(self, version, extract_bugs, data_types, repo=None):
+        with span("version", project=self.project.github_name, version=version, extract_bugs=extract_bugs):
+            return self._extract_features_to_version(version, extract_bugs, data_types, repo)
+
+    def _extract_features_to_version(self, version, extract_bugs, data_types, repo=None):
+        """
+        repo is the checkout of version to extract (a worktree), by default version is checked out in the project clone,
+        or exported to a snapshot with snapshots.
+        """
+        if repo is None and self.snapshots:
+            from worktrees import get_snapshots_dir, snapshot_repo
+            snapshot_dir = os.path.join(get_snapshots_dir(self.project), "0")
+            self.extractor.checkout_version(version, snapshot_dir)
+            repo = snapshot_repo(self.project, snapshot_dir)
+        elif repo is None:
+            self.extractor.checkout_version(version)
+        db, extractors_to_run = self.get_extractors(data_types, extract_bugs, version, repo)
         for extractor in extractors_to_run:
             start = time.time()
             try:
@@ -233,12 +304,14 @@ class Main():
                 traceback.print_exc()
                 print(r"extractor {0} failed".format(extractor.__class__.__name__))
         classes_df, methods_df = db.build()
-        try:
-            aggregated_methods_df = self.aggrate_methods_df(methods_df)
-            aggregated_classes_df = self.merge_aggregated_methods_to_class(aggregated_methods_df, classes_df)
-        except:
-            aggregated_classes_df = classes_df
-            aggregated_methods_df = methods_df
+        with span("aggregate", project=self.project.github_name, version=version) as s:
+            try:
+                aggregated_methods_df = self.aggrate_methods_df(methods_df)
+                aggregated_classes_df = self.merge_aggregated_methods_to_class(aggregated_methods_df, classes_df)
+            except:
+                aggregated_classes_df = classes_df
+                aggregated_methods_df = methods_df
+            s.set(rows=len(aggregated_classes_df) if aggregated_classes_df is not None else 0)
         classes_df = self.fillna(classes_df)
         try:
             methods_df = self.fillna(methods_df)
@@ -279,14 +352,19 @@ class Main():
         self.save_to_csv(aggregated_classes_df, os.path.join(classes_data, version + "_aggregated_classes_.csv"))
         self.save_to_csv(methods_df, os.path.join(method_data, version + ".csv"))
 
-    def get_extractors(self, data_types, extract_bugs, version):
+    def add_bugged_data_types(self, data_types):
+        data_types.add("bugged")
+        if not self.quick_mode:
+            data_types.add("bugged_methods")
+
+    def get_extractors(self, data_types, extract_bugs, version, repo=None):
+        from metrics.version_metrics import Extractor
+        from metrics.version_metrics_data import DataBuilder
         db = DataBuilder(self.project, version)
         if extract_bugs:
-            data_types.add("bugged")
-            if not self.quick_mode:
-                data_types.add("bugged_methods")
+            self.add_bugged_data_types(data_types)
         extractors_to_run = set()
-        for extractor in Extractor.get_all_extractors(self.project, version):
+        for extractor in Extractor.get_all_extractors(self.project, version, repo):
             if not extract_bugs and "bugged" in extractor.__class__.__name__.lower():
                 continue
             extractor_data_types = []
@@ -298,6 +376,8 @@ class Main():
         return db, extractors_to_run
 
     def extract_classes_datasets(self, training_datasets, testing_dataset, sub_dir="classes"):
+        import pandas as pd
+        from classification_instance import ClassificationInstance
         training = pd.concat(training_datasets, ignore_index=True).drop(["File", "Class", "Method_ids"], axis=1, errors='ignore')
         training = self.fillna(training)
         testing = testing_dataset.drop(["Method_ids", "Class"], axis=1, errors='ignore')
@@ -319,6 +399,8 @@ class Main():
         return path
 
     def extract_methods_datasets(self, training_datasets, testing_dataset):
+        import pandas as pd
+        from classification_instance import ClassificationInstance
         training = pd.concat(training_datasets, ignore_index=True).drop("Method_ids", axis=1, errors='ignore')
         training = self.fillna(training)
         testing = testing_dataset
@@ -341,8 +423,13 @@ class Main():
             os.path.join(Config().config['CACHING']['RepositoryData'], "dataname.json"))
         for d in DataNameEnum:
             j.append(d.value.as_description_dict())
+        content = json.dumps(j)
+        if os.path.exists(out_path):
+            with open(out_path) as f:
+                if f.read() == content:
+                    return
         with open(out_path, "w") as f:
-            json.dump(j, f)
+            f.write(content)
 
     def main(self):
         parser = argparse.ArgumentParser(description='Execute project data')
@@ -366,9 +453,20 @@ class Main():
         parser.add_argument('-r', '--only_rest', dest='only_rest', action='store_true', help='extract only rest versions')
         parser.add_argument('-a', '--all_rest', dest='all_rest', action='store_true', help='extract for all versions in the projects')
         parser.add_argument('-q', '--quick_mode', dest='quick_mode', action='store_true', help='quick_mode')
+        parser.add_argument('-w', '--workers', dest='workers', action='store', type=int, default=None,
+                            help='the number of versions to extract at the same time, each in its own git worktree. default: Workers in config.ini')
+        parser.add_argument('--snapshots', dest='snapshots', action='store_true', default=None,
+                            help='export the java files of every version to SnapshotsDir instead of checking it out. default: Checkout in config.ini')
+        parser.add_argument('--trace', dest='trace', action='store', help='write the timing spans of the run to this JSON lines file, see tracing.py', default=None)
         parser.add_argument('rest', nargs=argparse.REMAINDER)
         args = parser.parse_args()
+        if args.trace:
+            tracing.enable(args.trace)
         self.quick_mode = args.quick_mode
+        if args.workers is not None:
+            self.workers = args.workers
+        if args.snapshots:
+            self.snapshots = True
         print(vars(args))
         self.github_user_name = args.github_user_name
         self.jira_url = args.jira_url
@@ -378,6 +476,9 @@ class Main():
             self.set_project_enum(args.choose)
         if args.github_repo and args.jira_product:
             self.set_project(args.github_repo, args.github_user_name, args.jira_product, args.jira_url)
+        if self.project is None:
+            # nothing to extract, e.g. only listing the projects
+            return
         if args.list_selected:
             self.choose_versions(version_num=args.num_versions, algorithm=args.list_selected, version_type=VersionType[args.versions_type], strict=args.free_choose)
         if args.select == -1:
@@ -402,6 +503,23 @@ class Main():
                 self.create_all_but_one_dataset(data_types)
 
 
+def extract_version_in_worktree(project, quick_mode, version, extract_bugs, data_types, pool, path, cache_memory_limit):
+    """
+    extracts the features of version in the worktree at path of pool, in a worker process of Main.extract_versions.
+    """
+    from caching import MEMORY_CACHE, report_memory_cache
+    MEMORY_CACHE.resize(cache_memory_limit)
+    pool.checkout(path, version)
+    main = Main()
+    main.project = project
+    main.quick_mode = quick_mode
+    try:
+        return main.extract_features_to_version(version, extract_bugs, data_types, pool.repo(path))
+    finally:
+        # the pool processes exit without the atexit handlers
+        report_memory_cache(project=project.github_name, version=version)
+
+
 if __name__ == "__main__":
     m = Main()
     m.main()
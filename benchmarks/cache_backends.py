@@ -0,0 +1,55 @@
+"""
+compare the caching backends on a real cache entry.
+usage: python -m benchmarks.cache_backends caching/commits_and_issues/hadoop-<key>.gzip [-r repeats]
+"""
+import argparse
+import os
+import tempfile
+import time
+
+from caching import BACKENDS
+
+
+def load_entry(path):
+    for backend in BACKENDS.values():
+        if path.endswith(backend.extension):
+            return backend.load(path)
+    raise Exception("Error: unknown cache entry extension {0}".format(path))
+
+
+def benchmark(obj, repeats=3):
+    rows = []
+    out_dir = tempfile.mkdtemp()
+    for backend in BACKENDS.values():
+        path = os.path.join(out_dir, "entry" + backend.extension)
+        try:
+            store_times = []
+            load_times = []
+            for _ in range(repeats):
+                start = time.perf_counter()
+                backend.dump(obj, path)
+                store_times.append(time.perf_counter() - start)
+                start = time.perf_counter()
+                backend.load(path)
+                load_times.append(time.perf_counter() - start)
+            rows.append((backend.name, min(store_times), min(load_times), os.path.getsize(path)))
+            os.remove(path)
+        except ImportError as e:
+            print("skipping {0}: {1}".format(backend.name, e))
+    os.rmdir(out_dir)
+    return rows
+
+
+def main():
+    parser = argparse.ArgumentParser(description='benchmark the caching backends on a cache entry')
+    parser.add_argument('path', help='a cache entry, e.g. caching/commits_and_issues/<key>.gzip')
+    parser.add_argument('-r', '--repeats', dest='repeats', type=int, default=3, help='number of repeats, the best time is reported')
+    args = parser.parse_args()
+    obj = load_entry(args.path)
+    print("{0:<8} {1:>10} {2:>10} {3:>14}".format("backend", "store[s]", "load[s]", "size[bytes]"))
+    for name, store, load, size in benchmark(obj, args.repeats):
+        print("{0:<8} {1:>10.3f} {2:>10.3f} {3:>14}".format(name, store, load, size))
+
+
+if __name__ == "__main__":
+    main()
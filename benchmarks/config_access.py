@@ -0,0 +1,30 @@
+"""
+measure how often config.ini is parsed and what config access costs.
+usage: python -m benchmarks.config_access [-n accesses]
+"""
+import argparse
+import subprocess
+import sys
+import time
+
+IMPORT_MAIN = "import time; start = time.perf_counter(); import Main; from config import Config; " \
+              "print(time.perf_counter() - start, Config.loads)"
+
+
+def main():
+    parser = argparse.ArgumentParser(description='benchmark the config access')
+    parser.add_argument('-n', '--accesses', dest='accesses', type=int, default=100000)
+    args = parser.parse_args()
+    from config import Config
+    start = time.perf_counter()
+    for _ in range(args.accesses):
+        Config().config['REPO']['RepoDir']
+    per_access = (time.perf_counter() - start) / args.accesses
+    print("Config().config['REPO']['RepoDir']: {0:.2f} us per access".format(per_access * 1e6))
+    out = subprocess.run([sys.executable, "-c", IMPORT_MAIN], stdout=subprocess.PIPE, universal_newlines=True).stdout
+    import_time, loads = out.split()[-2:]
+    print("import Main: {0:.3f} s, config.ini parsed {1} times".format(float(import_time), loads))
+
+
+if __name__ == "__main__":
+    main()
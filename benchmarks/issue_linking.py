@@ -0,0 +1,99 @@
+"""
+compare the IssueLinker with the previous scan of _commits_and_issues on synthetic issues and commit messages.
+the links must be identical.
+usage: python -m benchmarks.issue_linking [-i 20000] [-c 5000]
+"""
+import argparse
+import random
+import time
+from datetime import datetime, timedelta, timezone
+
+from issue_linker import IssueLinker
+
+
+class SyntheticIssue(object):
+    def __init__(self, issue_id, creation_time):
+        self.issue_id = issue_id
+        self.creation_time = creation_time
+
+
+WORDS = ["fix", "bug", "typo", "in", "the", "parser", "refactor", "test", "npe", "merge", "branch", "trunk"]
+
+
+def synthetic_data(issues, commits, seed=0):
+    rnd = random.Random(seed)
+    start = datetime(2010, 1, 1, tzinfo=timezone(timedelta(hours=2)))
+    span = timedelta(days=3650)
+    # ids of a jira project are sequential in creation time, with some noise
+    synthetic_issues = list(map(lambda i: SyntheticIssue(str(i + 1), start + span * (i + rnd.random() * 50) / issues), range(issues)))
+    dates = sorted(map(lambda i: start + span * rnd.random(), range(commits)), reverse=True)
+    messages = []
+    for date in dates:
+        words = rnd.sample(WORDS, 4)
+        if rnd.random() < 0.7:
+            issue = str(rnd.randrange(1, issues + 1))
+            words.insert(rnd.randrange(len(words)), rnd.choice(["PROJ-" + issue, "#" + issue, issue + ":", "(bug " + issue + ")"]))
+        messages.append(" ".join(words))
+    return synthetic_issues, list(zip(messages, dates))
+
+
+def legacy_links(jira_issues, commits):
+    issues = dict(map(lambda x: (x.issue_id, x), jira_issues))
+    issues_dates = sorted(list(map(lambda x: (x, issues[x].creation_time), issues)), key=lambda x: x[1], reverse=True)
+
+    def replace(chars_to_replace, replacement, s):
+        temp_s = s
+        for c in chars_to_replace:
+            temp_s = temp_s.replace(c, replacement)
+        return temp_s
+
+    def get_bug_num_from_comit_text(commit_text, issues_ids):
+        text = replace("[]?#,:(){}'\"", "", commit_text.lower())
+        text = replace("-_.=", " ", text)
+        text = text.replace('bug', '').replace('fix', '')
+        for word in text.split():
+            if word.isdigit():
+                if word in issues_ids:
+                    return word
+        return "0"
+
+    links = []
+    for commit_text, committed_datetime in commits:
+        ind = 0
+        for ind, (issue_id, date) in enumerate(issues_dates):
+            date_ = date
+            if date_.tzinfo:
+                date_ = date_.replace(tzinfo=None)
+            if committed_datetime.replace(tzinfo=None) > date_:
+                break
+        issues_dates = issues_dates[ind:]
+        links.append(get_bug_num_from_comit_text(commit_text, set(map(lambda x: x[0], issues_dates))))
+    return links
+
+
+def linker_links(jira_issues, commits):
+    linker = IssueLinker(jira_issues)
+    return list(map(lambda c: linker.link(*c), commits))
+
+
+def timed(fn, *args):
+    start = time.perf_counter()
+    res = fn(*args)
+    return res, time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description='benchmark the linking of commits to issues')
+    parser.add_argument('-i', '--issues', dest='issues', type=int, default=20000)
+    parser.add_argument('-c', '--commits', dest='commits', type=int, default=5000)
+    args = parser.parse_args()
+    issues, commits = synthetic_data(args.issues, args.commits)
+    legacy, legacy_time = timed(legacy_links, issues, commits)
+    new, new_time = timed(linker_links, issues, commits)
+    assert legacy == new, "the links differ"
+    print("{0} issues, {1} commits, {2} links: scan {3:.2f} s, IssueLinker {4:.3f} s, identical".format(
+        len(issues), len(commits), len(list(filter(lambda l: l != "0", new))), legacy_time, new_time))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,36 @@
+"""
+assert that listing the projects stays under a time budget.
+usage: python -m benchmarks.startup [-b seconds] [-r repeats]
+"""
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+MAIN = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "Main.py")
+
+
+def measure(repeats):
+    times = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        subprocess.run([sys.executable, MAIN, "-p"], stdout=subprocess.DEVNULL, check=True, cwd=os.path.dirname(MAIN))
+        times.append(time.perf_counter() - start)
+    return times
+
+
+def main():
+    parser = argparse.ArgumentParser(description='benchmark the startup of Main.py -p')
+    parser.add_argument('-b', '--budget', dest='budget', type=float, default=1.0, help='the time budget in seconds')
+    parser.add_argument('-r', '--repeats', dest='repeats', type=int, default=5)
+    args = parser.parse_args()
+    times = measure(args.repeats)
+    median = statistics.median(times)
+    print("Main.py -p: median {0:.3f} s, min {1:.3f} s, max {2:.3f} s".format(median, min(times), max(times)))
+    assert median < args.budget, "Main.py -p took {0:.3f} s, over the budget of {1} s".format(median, args.budget)
+
+
+if __name__ == "__main__":
+    main()
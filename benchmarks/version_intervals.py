@@ -0,0 +1,84 @@
+"""
+compare the assignment of commits to version intervals with the previous list.index based one on a synthetic history.
+the previous assignment is O(versions * commits), it runs on --legacy_commits commits only, the mappings must be equal.
+usage: python -m benchmarks.version_intervals [-c 100000] [-t 2000] [-l 20000]
+"""
+import argparse
+import random
+import time
+
+from intervals import items_between_versions
+
+
+class SyntheticCommit(object):
+    __slots__ = ('binsha', 'committed_date')
+
+    def __init__(self, binsha, committed_date):
+        self.binsha = binsha
+        self.committed_date = committed_date
+
+    def __eq__(self, other):
+        return isinstance(other, SyntheticCommit) and self.binsha == other.binsha
+
+    def __hash__(self):
+        return hash(self.binsha)
+
+
+def synthetic_history(commits, tags, seed=0):
+    rnd = random.Random(seed)
+    start = 1000000000
+    # many commits share their second, as in imported histories
+    history = list(map(lambda i: SyntheticCommit(i.to_bytes(20, 'big'), start + rnd.randrange(commits * 10) // 3), range(commits)))
+    history.sort(key=lambda c: c.committed_date, reverse=True)
+    tagged = rnd.sample(history, tags)
+    # a few commits are tagged twice
+    tagged.extend(rnd.sample(tagged, max(1, tags // 100)))
+    return history, list(map(lambda c: SyntheticCommit(c.binsha, c.committed_date), tagged))
+
+
+def legacy_commits_between_versions(repo_commits, versions_commits):
+    sorted_versions = sorted(versions_commits, key=lambda version: version.committed_date)
+    sorted_commits_and_versions = sorted(sorted_versions + repo_commits, key=lambda c: c.committed_date)
+    versions_indices = list(map(lambda version: (version, sorted_commits_and_versions.index(version)), sorted_versions))
+    selected_versions = list(filter(lambda vers: vers[0][1] < vers[1][1], zip(versions_indices, versions_indices[1:])))
+    return dict(
+        map(lambda vers: (vers[0][0], sorted_commits_and_versions[vers[0][1] + 1: vers[1][1]]), selected_versions))
+
+
+def commits_between_versions(repo_commits, versions_commits):
+    return items_between_versions(sorted(versions_commits, key=lambda version: version.committed_date), repo_commits,
+                                  lambda c: c.committed_date, key=lambda c: c.binsha)
+
+
+def as_shas(mapping):
+    return list(map(lambda kv: (kv[0].binsha, list(map(lambda c: c.binsha, kv[1]))), mapping.items()))
+
+
+def timed(fn, *args):
+    start = time.perf_counter()
+    res = fn(*args)
+    return res, time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description='benchmark the version interval assignment')
+    parser.add_argument('-c', '--commits', dest='commits', type=int, default=100000)
+    parser.add_argument('-t', '--tags', dest='tags', type=int, default=2000)
+    parser.add_argument('-l', '--legacy_commits', dest='legacy_commits', type=int, default=20000)
+    args = parser.parse_args()
+
+    legacy_tags = max(2, args.tags * args.legacy_commits // args.commits)
+    history, tags = synthetic_history(args.legacy_commits, legacy_tags)
+    legacy, legacy_time = timed(legacy_commits_between_versions, history, tags)
+    new, new_time = timed(commits_between_versions, history, tags)
+    assert as_shas(legacy) == as_shas(new), "the interval assignments differ"
+    print("{0} commits, {1} tags: list.index {2:.2f} s, sort {3:.3f} s, identical".format(
+        len(history), len(tags), legacy_time, new_time))
+
+    history, tags = synthetic_history(args.commits, args.tags)
+    new, new_time = timed(commits_between_versions, history, tags)
+    print("{0} commits, {1} tags: sort {2:.3f} s, {3} intervals".format(len(history), len(tags), new_time, len(new)))
+
+
+if __name__ == "__main__":
+    main()
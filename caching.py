@@ -1,7 +1,21 @@
+import atexit
 import os
+import errno
+import json
+import mmap
 import pickle
 import gzip
+import struct
+import hashlib
+import inspect
+import subprocess
+import time
+from collections import OrderedDict
+from datetime import datetime
+from enum import Enum
+from functools import wraps
 from config import Config
+from tracing import span
 
 
 REPOSITORY_DATA_DIR = Config.get_work_dir_path(Config().config['CACHING']['RepositoryData'])
@@ -18,41 +32,687 @@ assert REPOSITORY_DATA_DIR and assert_dir_exists(REPOSITORY_DATA_DIR)
 assert REPOSITORY_CACHING_DIR and assert_dir_exists(REPOSITORY_CACHING_DIR)
 
 
-def cached(cache_name, cache_dir=REPOSITORY_CACHING_DIR):
+def _canonical(value):
+    """
+    a deterministic textual form of value, used to build cache keys that are stable between processes.
+    objects without a stable form raise TypeError, declare a transform for them in key_args instead.
+    """
+    if value is None or isinstance(value, (bool, int, float, str, bytes)):
+        return repr(value)
+    if isinstance(value, Enum):
+        return value.name
+    if isinstance(value, datetime):
+        return value.isoformat()
+    if isinstance(value, (list, tuple)):
+        return "[" + ",".join(map(_canonical, value)) + "]"
+    if isinstance(value, (set, frozenset)):
+        return "{" + ",".join(sorted(map(_canonical, value))) + "}"
+    if isinstance(value, dict):
+        return "{" + ",".join(sorted(map(lambda kv: _canonical(kv[0]) + ":" + _canonical(kv[1]), value.items()))) + "}"
+    if hasattr(value, 'github_name'):
+        return value.github_name
+    raise TypeError("can not build a stable cache key from {0}".format(type(value).__name__))
+
+
+def stable_hash(value):
+    return hashlib.sha1(_canonical(value).encode('utf-8')).hexdigest()
+
+
+_FINGERPRINTS = {}
+
+
+def _refs_signature(path):
+    """
+    modification times of the files git updates when HEAD, a branch, a branch of the origin or a tag moves:
+    HEAD, packed-refs and every directory of the loose refs, a ref is written by a rename into its directory
+    (e.g. refs/tags/release for a new tag release/x). None when they can not be checked (e.g. a worktree, where .git
+    is a file).
+    """
+    git_dir = os.path.join(path, '.git')
+    if not os.path.isdir(git_dir):
+        return None
+    signature = []
+    for name in ['HEAD', 'packed-refs']:
+        try:
+            signature.append((name, os.stat(os.path.join(git_dir, name)).st_mtime_ns))
+        except OSError:
+            signature.append((name, None))
+    for name in [os.path.join('refs', 'heads'), os.path.join('refs', 'remotes', 'origin'), os.path.join('refs', 'tags')]:
+        for dir_path, _, _ in os.walk(os.path.join(git_dir, name)):
+            try:
+                signature.append((os.path.relpath(dir_path, git_dir), os.stat(dir_path).st_mtime_ns))
+            except OSError:
+                pass
+    return tuple(sorted(signature))
+
+
+def repository_fingerprint(path):
+    """
+    fingerprint of the git repository at path: the sha of its default branch and the set of tags.
+    HEAD is not part of it, the pipeline moves HEAD itself when it checks out the versions.
+    returns '' when path is not a git repository (e.g. not cloned yet).
+    the fingerprint is remembered until the refs of the repository change.
+    """
+    from git_log import default_ref
+    def git(*args):
+        return subprocess.run(['git'] + list(args), cwd=path, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL,
+                              universal_newlines=True).stdout
+    if not os.path.isdir(path):
+        return ''
+    signature = _refs_signature(path)
+    if signature is not None and _FINGERPRINTS.get(path, (None, None))[0] == signature:
+        return _FINGERPRINTS[path][1]
+    head = git('rev-parse', '--verify', '-q', default_ref(path)).strip()
+    if not head:
+        return ''
+    tags = sorted(git('show-ref', '--tags').splitlines())
+    fingerprint = stable_hash([head, tags])
+    if signature is not None:
+        _FINGERPRINTS[path] = (signature, fingerprint)
+    return fingerprint
+
+
+class CacheBackend(object):
+    """
+    serialization of a single cache entry. every backend writes its own file extension,
+    so entries written by other backends can still be found and read.
+    """
+    name = None
+    extension = None
+
+    def dump(self, obj, path):
+        """
+        write obj to path, returns the size of the pickled obj in bytes.
+        """
+        raise NotImplementedError()
+
+    def load_with_size(self, path):
+        """
+        returns the obj stored in path and the size of its pickle in bytes.
+        """
+        raise NotImplementedError()
+
+    def load(self, path):
+        return self.load_with_size(path)[0]
+
+
+class GzipBackend(CacheBackend):
+    name = 'gzip'
+    extension = '.gzip'
+
+    def __init__(self, compresslevel=9):
+        self.compresslevel = compresslevel
+
+    def dump(self, obj, path):
+        with gzip.GzipFile(path, 'wb', compresslevel=self.compresslevel) as cachehandle:
+            pickle.dump(obj, cachehandle, pickle.HIGHEST_PROTOCOL)
+            return cachehandle.tell()
+
+    def load_with_size(self, path):
+        with gzip.GzipFile(path, 'rb') as cachehandle:
+            return pickle.load(cachehandle), cachehandle.tell()
+
+
+class PickleBackend(CacheBackend):
+    """
+    uncompressed pickle protocol 5. buffers that support out-of-band pickling (numpy arrays, bytearrays)
+    are written raw after the pickle stream and loaded back without copying, as views of the memory mapped file.
+    layout: magic, number of buffers, the length of the pickle stream and of every buffer, the pickle stream, the buffers.
+    """
+    name = 'pickle'
+    extension = '.pkl'
+    MAGIC = b'RMP5'
+
+    def dump(self, obj, path):
+        buffers = []
+        data = pickle.dumps(obj, protocol=5, buffer_callback=buffers.append)
+        raws = list(map(lambda b: b.raw(), buffers))
+        with open(path, 'wb') as f:
+            f.write(self.MAGIC)
+            f.write(struct.pack('<I', len(raws)))
+            f.write(struct.pack('<{0}Q'.format(len(raws) + 1), len(data), *map(lambda r: r.nbytes, raws)))
+            f.write(data)
+            for raw in raws:
+                f.write(raw)
+            return f.tell()
+
+    def load_with_size(self, path):
+        with open(path, 'rb') as f:
+            if os.name == 'nt':
+                # a mapped file can not be replaced or evicted on windows
+                content = bytearray(f.read())
+            else:
+                # the buffers (e.g. the numpy columns of a CommitStore) are views of the copy on write mapping of the file
+                content = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_COPY)
+        view = memoryview(content)
+        if bytes(view[:4]) != self.MAGIC:
+            raise ValueError("{0} is not a pickle cache entry".format(path))
+        count, = struct.unpack_from('<I', view, 4)
+        lengths = struct.unpack_from('<{0}Q'.format(count + 1), view, 8)
+        offset = 8 + 8 * (count + 1)
+        parts = []
+        for length in lengths:
+            parts.append(view[offset: offset + length])
+            offset += length
+        return pickle.loads(parts[0], buffers=parts[1:]), len(content)
+
+
+class Lz4Backend(CacheBackend):
+    """
+    pickle compressed with the lz4 frame format, several times faster than gzip to read. requires the lz4 package.
+    """
+    name = 'lz4'
+    extension = '.lz4'
+
+    def dump(self, obj, path):
+        import lz4.frame
+        with lz4.frame.open(path, 'wb') as cachehandle:
+            pickle.dump(obj, cachehandle, pickle.HIGHEST_PROTOCOL)
+            return cachehandle.tell()
+
+    def load_with_size(self, path):
+        import lz4.frame
+        with lz4.frame.open(path, 'rb') as cachehandle:
+            return pickle.load(cachehandle), cachehandle.tell()
+
+
+BACKENDS = {b.name: b for b in [GzipBackend(), PickleBackend(), Lz4Backend()]}
+
+
+def get_backend(name=None):
+    if name is None:
+        name = Config().config['CACHING'].get('Backend', GzipBackend.name)
+    if name not in BACKENDS:
+        raise Exception("Error: unknown caching backend {0}, choose one of {1}".format(name, list(BACKENDS)))
+    return BACKENDS[name]
+
+
+class MemoryCache(object):
+    """
+    in-process LRU tier in front of the cache files. the size of an entry is the size of its uncompressed pickle,
+    the least recently used entries are evicted when the total exceeds max_bytes.
+    max_bytes is a budget of serialized bytes: the unpickled objects take several times more memory (an object per
+    commit or issue), and every process has its own tier.
+    hits and misses count the lookups of the tier, a miss is read from the cache file or computed.
+    the cached objects are shared between the callers, so they should not be modified.
+    """
+    def __init__(self, max_bytes):
+        self.max_bytes = max_bytes
+        self.entries = OrderedDict()
+        self.total_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key):
+        if key in self.entries:
+            self.hits += 1
+            self.entries.move_to_end(key)
+            return True, self.entries[key][0]
+        self.misses += 1
+        return False, None
+
+    def put(self, key, value, size):
+        self.discard(key)
+        if size > self.max_bytes:
+            return
+        self.entries[key] = (value, size)
+        self.total_bytes += size
+        while self.total_bytes > self.max_bytes:
+            _, (_, evicted_size) = self.entries.popitem(last=False)
+            self.total_bytes -= evicted_size
+            self.evictions += 1
+
+    def resize(self, max_bytes):
+        self.max_bytes = max_bytes
+        while self.total_bytes > self.max_bytes:
+            _, (_, evicted_size) = self.entries.popitem(last=False)
+            self.total_bytes -= evicted_size
+            self.evictions += 1
+
+    def discard(self, key):
+        if key in self.entries:
+            self.total_bytes -= self.entries.pop(key)[1]
+
+    def clear(self):
+        self.entries.clear()
+        self.total_bytes = 0
+
+    def stats(self):
+        return {'entries': len(self.entries), 'bytes': self.total_bytes, 'max_bytes': self.max_bytes,
+                'hits': self.hits, 'misses': self.misses, 'evictions': self.evictions}
+
+
+def memory_limit(workers=None):
+    """
+    the budget of the memory tier of a process: MemoryLimitMB of the CACHING section, split between the main process
+    and the workers when the versions are extracted by several workers (by default Workers of the VERSION_METRICS section).
+    the budget counts uncompressed pickle bytes, the resident memory of the loaded entries is several times larger.
+    """
+    config = Config().config
+    if workers is None:
+        workers = int(config['VERSION_METRICS'].get('Workers', '1')) if config.has_section('VERSION_METRICS') else 1
+    processes = workers + 1 if workers > 1 else 1
+    return int(config['CACHING'].get('MemoryLimitMB', '256')) * 1024 * 1024 // processes
+
+
+MEMORY_CACHE = MemoryCache(memory_limit())
+
+
+def disable_memory_cache():
+    """
+    the initializer of the short lived pool processes (e.g. of the blame), they read and compute an entry once
+    and do not take a share of MemoryLimitMB.
+    """
+    MEMORY_CACHE.resize(0)
+
+
+def report_memory_cache(**attributes):
+    """
+    writes the counters of the memory tier of this process as a "memory_cache" span (see tracing), at the exit of the
+    process and at the end of every version a worker extracts.
+    """
+    with span("memory_cache", **attributes) as s:
+        s.set(**MEMORY_CACHE.stats())
+
+
+atexit.register(report_memory_cache)
+
+
+def _entry_extensions():
+    return set(map(lambda b: b.extension, BACKENDS.values()))
+
+
+def iter_entries(cache_dir=REPOSITORY_CACHING_DIR):
+    """
+    yields (namespace, path, size, last_access) for every entry under cache_dir.
+    the namespace is the cache_name of the entry, the last access is the mtime, which is touched on every read.
+    """
+    extensions = _entry_extensions()
+    for namespace in os.scandir(cache_dir):
+        if not namespace.is_dir():
+            continue
+        for root, dirs, files in os.walk(namespace.path):
+            for name in files:
+                if os.path.splitext(name)[1] not in extensions:
+                    continue
+                path = os.path.join(root, name)
+                try:
+                    stat = os.stat(path)
+                except OSError:
+                    continue
+                yield namespace.name, path, stat.st_size, stat.st_mtime
+
+
+def cache_stats(cache_dir=REPOSITORY_CACHING_DIR):
+    """
+    per namespace statistics: number of entries, total bytes and the oldest and newest access.
+    """
+    stats = {}
+    for namespace, path, size, last_access in iter_entries(cache_dir):
+        ns = stats.setdefault(namespace, {'entries': 0, 'bytes': 0, 'oldest': last_access, 'newest': last_access})
+        ns['entries'] += 1
+        ns['bytes'] += size
+        ns['oldest'] = min(ns['oldest'], last_access)
+        ns['newest'] = max(ns['newest'], last_access)
+    return stats
+
+
+def _eviction_order(entries, policy, now):
+    if policy == 'lru':
+        return sorted(entries, key=lambda e: e[3])
+    if policy == 'size':
+        # large entries that were not used for a long time go first
+        return sorted(entries, key=lambda e: (now - e[3]) * e[2], reverse=True)
+    raise Exception("Error: unknown eviction policy {0}, choose one of ['lru', 'size']".format(policy))
+
+
+# the bytes of the entries under a cache dir, as last counted by this process plus what it wrote since
+_DISK_USAGE = {}
+
+
+def _quota_bytes():
+    return int(Config().config['CACHING'].get('QuotaMB', '0')) * 1024 * 1024
+
+
+def note_write(path, cache_dir=REPOSITORY_CACHING_DIR):
+    """
+    adds the entry written to path to the usage of cache_dir and prunes it when the usage exceeds the quota.
+    the entries are walked once per process, and again only when the quota is exceeded. the cache is pruned to 90% of
+    the quota, so the next writes do not prune it again right away.
+    """
+    quota_bytes = _quota_bytes()
+    if not quota_bytes:
+        return
+    cache_dir = str(cache_dir)
+    if cache_dir in _DISK_USAGE:
+        try:
+            _DISK_USAGE[cache_dir] += os.path.getsize(path)
+        except OSError:
+            pass
+    else:
+        _DISK_USAGE[cache_dir] = sum(map(lambda e: e[2], iter_entries(cache_dir)))
+    if _DISK_USAGE[cache_dir] > quota_bytes:
+        prune(quota_bytes * 9 // 10, cache_dir=cache_dir, keep=[path])
+        _DISK_USAGE[cache_dir] = sum(map(lambda e: e[2], iter_entries(cache_dir)))
+
+
+def prune(quota_bytes=None, policy=None, cache_dir=REPOSITORY_CACHING_DIR, keep=(), dry_run=False):
+    """
+    evict entries until the cache fits in quota_bytes, by default QuotaMB of the CACHING section (0 is unlimited).
+    the policy is 'lru' or 'size' (least recently used weighted by size), by default EvictionPolicy of the CACHING section.
+    paths in keep are never evicted. returns the evicted entries.
+    """
+    config = Config().config['CACHING']
+    if quota_bytes is None:
+        quota_bytes = _quota_bytes()
+    if policy is None:
+        policy = config.get('EvictionPolicy', 'lru')
+    if not quota_bytes:
+        return []
+    keep = set(map(os.path.normpath, map(str, keep)))
+    entries = list(iter_entries(cache_dir))
+    total = sum(map(lambda e: e[2], entries))
+    evicted = []
+    for entry in _eviction_order(entries, policy, time.time()):
+        if total <= quota_bytes:
+            break
+        if os.path.normpath(entry[1]) in keep:
+            continue
+        if not dry_run:
+            try:
+                os.remove(entry[1])
+            except OSError:
+                continue
+        total -= entry[2]
+        evicted.append(entry)
+    if not dry_run:
+        remove_stale_locks(cache_dir)
+    return evicted
+
+
+def remove_stale_locks(cache_dir=REPOSITORY_CACHING_DIR):
+    """
+    removes the lock files under cache_dir that no process holds, returns their number.
+    """
+    removed = 0
+    for root, dirs, files in os.walk(cache_dir):
+        for name in filter(lambda n: n.endswith(".lock"), files):
+            lock = FileLock(os.path.join(root, name))
+            try:
+                if lock.acquire(blocking=False) is None:
+                    continue
+            except OSError:
+                continue
+            lock.remove()
+            lock.release()
+            removed += 1
+    return removed
+
+
+class FileLock(object):
+    """
+    an exclusive lock on a file, shared between processes. the lock is released when the holder exits,
+    so a crashed process never leaves a stale lock behind.
+    remove() deletes the lock file when it is released, once what it protects is done (e.g. the entry is written):
+    a process that still waits on the removed file gets the lock after that and finds the entry.
+    """
+    # the errors of a lock that is held by another process, any other error (e.g. ENOLCK on nfs) is raised
+    BUSY = (errno.EAGAIN, errno.EWOULDBLOCK, errno.EACCES)
+
+    def __init__(self, path):
+        self.path = path
+        self.fd = None
+        self.removed = False
+
+    def _try_lock(self):
+        if os.name == 'nt':
+            import msvcrt
+            msvcrt.locking(self.fd, msvcrt.LK_NBLCK, 1)
+        else:
+            import fcntl
+            fcntl.flock(self.fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+
+    def acquire(self, poll_interval=1, blocking=True):
+        """
+        returns the lock once it is held, without blocking None when another process holds it.
+        """
+        self.fd = os.open(self.path, os.O_RDWR | os.O_CREAT)
+        waiting = False
+        while True:
+            try:
+                self._try_lock()
+                return self
+            except OSError as e:
+                if e.errno not in self.BUSY or not blocking:
+                    os.close(self.fd)
+                    self.fd = None
+                    if not blocking and e.errno in self.BUSY:
+                        return None
+                    raise
+                if not waiting:
+                    print(f"waiting for {self.path}")
+                    waiting = True
+                time.sleep(poll_interval)
+
+    def remove(self):
+        self.removed = True
+        if os.name != 'nt':
+            # unlinked while it is held, a process that opens the path from now on locks a new file
+            self._unlink()
+
+    def _unlink(self):
+        try:
+            os.remove(self.path)
+        except OSError:
+            pass
+
+    def release(self):
+        if os.name == 'nt':
+            import msvcrt
+            os.lseek(self.fd, 0, os.SEEK_SET)
+            msvcrt.locking(self.fd, msvcrt.LK_UNLCK, 1)
+        else:
+            import fcntl
+            fcntl.flock(self.fd, fcntl.LOCK_UN)
+        os.close(self.fd)
+        self.fd = None
+        if self.removed and os.name == 'nt':
+            # an open file can not be removed on windows, it stays if another process opened it meanwhile
+            self._unlink()
+
+    def __enter__(self):
+        return self.acquire()
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.release()
+
+
+def atomic_dump(backend, obj, path, retries=5):
+    """
+    write obj to a temporary file next to path and rename it over path,
+    so readers see either the previous entry or the complete new one.
+    """
+    tmp_path = "{0}.{1}.tmp".format(path, os.getpid())
+    try:
+        size = backend.dump(obj, tmp_path)
+        for attempt in range(retries):
+            try:
+                os.replace(tmp_path, path)
+                break
+            except PermissionError:
+                # on windows the target can not be replaced while a reader holds it open
+                if attempt == retries - 1:
+                    raise
+                time.sleep(1)
+        return size
+    finally:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+
+
+def _state_path(cache_name, name, cache_dir):
+    return os.path.join(*assert_dir_exists(cache_dir.joinpath(cache_name)).joinpath(name + ".state.json").parts)
+
+
+def read_state(cache_name, name, cache_dir=REPOSITORY_CACHING_DIR):
+    """
+    the bookkeeping of an incrementally computed entry (e.g. the last mined sha and the key of its result), {} if missing.
+    state files are small json files next to the entries of cache_name, they are not counted or evicted by prune.
+    """
+    path = _state_path(cache_name, name, cache_dir)
+    if not os.path.exists(path):
+        return {}
+    try:
+        with open(path) as f:
+            return json.load(f)
+    except ValueError:
+        return {}
+
+
+def write_state(cache_name, name, state, cache_dir=REPOSITORY_CACHING_DIR):
+    path = _state_path(cache_name, name, cache_dir)
+    tmp_path = "{0}.{1}.tmp".format(path, os.getpid())
+    with open(tmp_path, "w") as f:
+        json.dump(state, f)
+    os.replace(tmp_path, path)
+
+
+def _touch(path):
+    try:
+        os.utime(path)
+    except OSError:
+        pass
+
+
+def _key_name(key):
+    if type(key) != type(''):
+        return key.github_name
+    return key
+
+
+def _is_default(parameter, value):
+    default = parameter.default
+    return default is not inspect.Parameter.empty and type(value) == type(default) and value == default
+
+
+def cached(cache_name, cache_dir=REPOSITORY_CACHING_DIR, key_args=(), fingerprint=False, backend=None):
     """
     A function that creates a decorator which will use "cachefile" for caching the results of the decorated function "fn".
+    The entry is keyed by the first argument (a name or a project). key_args declares which other arguments of "fn"
+    are part of the key, either as a list of argument names or as a dict of argument name -> transform, where the transform
+    maps the argument to a hashable value (e.g. the issues list to their ids).
+    an argument left at its default value is not part of the key, so declaring an argument with a default keeps the
+    names of the entries written before (e.g. the jira issues of the default url).
+    fingerprint=True adds the fingerprint of the repository at key.path, so the entry is invalidated when the repository
+    changes, such an entry is always named by its arguments and the fingerprint.
+    backend is the name of the serialization backend, by default the Backend of the CACHING section in config.ini.
     """
+    cache_root = cache_dir
     cache_dir = cache_dir.joinpath(cache_name)
     assert_dir_exists(cache_dir)
+    backend = get_backend(backend)
+    backends = [backend] + list(filter(lambda b: b is not backend, BACKENDS.values()))
+    if not isinstance(key_args, dict):
+        key_args = dict.fromkeys(key_args)
 
     def decorator(fn):  # define a decorator for a function "fn"
-        def wrapped(key='KEY', *args, **kwargs):   # define a wrapper that will finally call "fn" with all arguments
-            key_ = key
-            if type(key) != type(''):
-                key_ = key.github_name
-            gzip_cachefile = cache_dir.joinpath(key_ + ".gzip")
-            assert_dir_exists(gzip_cachefile.parent)
-            if gzip_cachefile.exists():
-                try:
-                    with gzip.GzipFile(gzip_cachefile, 'rb') as cachehandle:
-                        print(f"read {key_} from cache")
-                        return pickle.load(cachehandle)
-                except Exception as e:
-                    pass
-            # execute the function with all arguments passed
-            if fn.__code__.co_argcount == 0:
-                res = fn(*args, **kwargs)
-            else:
-                res = fn(key, *args, **kwargs)
+        signature = inspect.signature(fn)
 
-            # write to cache file
-            try:
-                with gzip.GzipFile(os.path.join(*gzip_cachefile.parts), 'wb') as cachehandle:
-                    pickle.dump(res, cachehandle, pickle.HIGHEST_PROTOCOL)
-            except Exception as e:
-                raise e
+        def cache_key(key='KEY', *args, **kwargs):
+            key_ = _key_name(key)
+            parts = []
+            if key_args:
+                bound = signature.bind(key, *args, **kwargs)
+                bound.apply_defaults()
+                for name, transform in key_args.items():
+                    value = bound.arguments[name]
+                    if _is_default(signature.parameters[name], value):
+                        continue
+                    parts.append((name, transform(value) if transform else value))
+            if fingerprint and hasattr(key, 'path'):
+                parts.append(('fingerprint', repository_fingerprint(key.path)))
+            if parts:
+                key_ = "{0}-{1}".format(key_, stable_hash(parts)[:16])
+            return key_
+
+        def load(key_):
+            for b in backends:
+                cachefile = cache_dir.joinpath(key_ + b.extension)
+                if cachefile.exists():
+                    try:
+                        res, size = b.load_with_size(cachefile)
+                    except Exception as e:
+                        print(f"failed to read {cachefile}: {e!r}")
+                        continue
+                    print(f"read {key_} from cache")
+                    _touch(cachefile)
+                    return True, res, size
+            return False, None, None
+
+        @wraps(fn)
+        def wrapped(key='KEY', *args, **kwargs):   # define a wrapper that will finally call "fn" with all arguments
+            key_ = cache_key(key, *args, **kwargs)
+            memory_key = (str(cache_dir), key_)
+            found, res = MEMORY_CACHE.get(memory_key)
+            if found:
+                return res
+            found, res, size = load(key_)
+            if found:
+                MEMORY_CACHE.put(memory_key, res, size)
+                return res
+            cachefile = cache_dir.joinpath(key_ + backend.extension)
+            assert_dir_exists(cachefile.parent)
+            # only one process computes a key, the others wait for it and read its result
+            with FileLock(os.path.join(*cache_dir.joinpath(key_ + ".lock").parts)) as lock:
+                found, res, size = load(key_)
+                if not found:
+                    # execute the function with all arguments passed
+                    if fn.__code__.co_argcount == 0:
+                        res = fn(*args, **kwargs)
+                    else:
+                        res = fn(key, *args, **kwargs)
+                    # write to cache file
+                    size = atomic_dump(backend, res, os.path.join(*cachefile.parts))
+                    note_write(os.path.join(*cachefile.parts), cache_root)
+                # the entry exists, the lock file is not needed anymore
+                lock.remove()
+            MEMORY_CACHE.put(memory_key, res, size)
             return res
 
+        wrapped.cache_key = cache_key
+        # reads a stored entry by its key without computing it, (found, result)
+        wrapped.read = lambda key_: load(key_)[:2]
         return wrapped
 
-    return decorator   # return this "customized" decorator that uses "cachefile"
+    return decorator   # return this "customized" decorator that uses "cachefile" for caching
+
+
+def main():
+    import argparse
+    parser = argparse.ArgumentParser(description='Inspect and prune the repository cache')
+    parser.add_argument('command', choices=['stats', 'prune'])
+    parser.add_argument('-q', '--quota', dest='quota', type=int, default=None, help='the quota in MB, default: QuotaMB in config.ini')
+    parser.add_argument('-e', '--eviction_policy', dest='policy', choices=['lru', 'size'], default=None, help='default: EvictionPolicy in config.ini')
+    parser.add_argument('-n', '--dry_run', dest='dry_run', action='store_true', help='only list the entries to evict')
+    args = parser.parse_args()
+    if args.command == 'stats':
+        stats = cache_stats()
+        print("{0:<40} {1:>8} {2:>12} {3:>20} {4:>20}".format("namespace", "entries", "MB", "oldest access", "newest access"))
+        for namespace, ns in sorted(stats.items(), key=lambda x: x[1]['bytes'], reverse=True):
+            print("{0:<40} {1:>8} {2:>12.1f} {3:>20} {4:>20}".format(namespace, ns['entries'], ns['bytes'] / 1024 / 1024,
+                                                                     time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(ns['oldest'])),
+                                                                     time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(ns['newest']))))
+        print("total: {0:.1f} MB".format(sum(map(lambda ns: ns['bytes'], stats.values())) / 1024 / 1024))
+    else:
+        quota = None if args.quota is None else args.quota * 1024 * 1024
+        evicted = prune(quota, args.policy, dry_run=args.dry_run)
+        for namespace, path, size, last_access in evicted:
+            print("evict", path, size)
+        print("evicted {0} entries, {1:.1f} MB".format(len(evicted), sum(map(lambda e: e[2], evicted)) / 1024 / 1024))
+        if not args.dry_run:
+            print("removed {0} stale lock files".format(remove_stale_locks()))
+
+
+if __name__ == "__main__":
+    main()
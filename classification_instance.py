@@ -5,6 +5,7 @@ import pandas as pd
 import json
 import os
 import sklearn.metrics as metrics
+from tracing import span
 
 
 class ClassificationInstance(object):
@@ -50,10 +51,12 @@ class ClassificationInstance(object):
     def predict(self):
         classifier = RandomForestClassifier(n_estimators=1000, random_state=42)
         # classifier = GaussianProcessClassifier(kernel=RBF(), max_iter_predict=20, n_restarts_optimizer=0, warm_start=True)
-        model = classifier.fit(self.training_X, self.training_y)
-        classes = list(map(lambda x: str(x) + "_probability", classifier.classes_.tolist()))
-        predictions_proba = list(zip(*classifier.predict_proba(self.testing_X)))
-        predictions = list(classifier.predict(self.testing_X))
+        with span("train", dataset=self.prediction_path, rows=len(self.training_X), features=len(self.features_list)):
+            model = classifier.fit(self.training_X, self.training_y)
+        with span("predict", dataset=self.prediction_path, rows=len(self.testing_X)):
+            classes = list(map(lambda x: str(x) + "_probability", classifier.classes_.tolist()))
+            predictions_proba = list(zip(*classifier.predict_proba(self.testing_X)))
+            predictions = list(classifier.predict(self.testing_X))
         self.importance = dict(zip(self.features_list, classifier.feature_importances_.tolist()))
         if self.save_all:
             with open(self.importance_path, "w") as f:
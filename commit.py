@@ -1,5 +1,7 @@
+import os
 import re
 import time
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
 try:
     from javadiff.javadiff.SourceFile import SourceFile
@@ -8,6 +10,48 @@ except:
     from javadiff.SourceFile import SourceFile
     from javadiff.diff import get_commit_methods
 
+from caching import cached
+from config import Config
+
+
+@cached('commit_methods', key_args=['commit_id'])
+def read_commit_methods(repo_name, repo_dir, commit_id):
+    """
+    the methods of the files changed by the commit, parsed by javadiff and cached per commit sha.
+    """
+    return get_commit_methods(repo_dir, commit_id, analyze_source_lines=False)
+
+
+def _repo_name(repo_dir):
+    return os.path.basename(os.path.normpath(repo_dir))
+
+
+def _read_commit_methods(repo_dir, commit_id):
+    return read_commit_methods(_repo_name(repo_dir), repo_dir, commit_id)
+
+
+def get_commits_methods(commits, workers=None):
+    """
+    Commit.get_commit_methods of every commit of commits. the bug commits that are not cached yet are parsed by
+    workers processes, by default MethodsWorkers of the DATA_EXTRACTION section (0 is one per cpu).
+    """
+    if workers is None:
+        workers = int(Config().config['DATA_EXTRACTION'].get('MethodsWorkers', '0')) or None
+    missing = []
+    for commit in filter(lambda c: c.is_bug() and len(c._methods) == 0, commits):
+        found, methods = read_commit_methods.read(
+            read_commit_methods.cache_key(_repo_name(commit._repo_dir), commit._repo_dir, commit._commit_id))
+        if found:
+            commit._methods = methods
+        else:
+            missing.append(commit)
+    if len(missing) > 1 and workers != 1:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            methods = executor.map(_read_commit_methods, map(lambda c: c._repo_dir, missing), map(lambda c: c._commit_id, missing))
+            for commit, commit_methods in zip(missing, methods):
+                commit._methods = commit_methods
+    return list(map(lambda c: c.get_commit_methods(), commits))
+
 
 class CommittedFile(object):
     def __init__(self, sha, name, insertions, deletions):
@@ -24,15 +68,17 @@ class CommittedFile(object):
 
 class Commit(object):
     def __init__(self, bug_id, git_commit, issue=None, files=None, is_java_commit=True):
-        self._commit_id = git_commit.hexsha
-        self._repo_dir = git_commit.repo.working_dir
+        self._init(bug_id, git_commit.hexsha, git_commit.repo.working_dir, git_commit.committed_datetime, issue, files,
+                   is_java_commit)
+
+    def _init(self, bug_id, commit_id, repo_dir, committed_datetime, issue, files, is_java_commit):
+        self._commit_id = commit_id
+        self._repo_dir = repo_dir
         self._issue_id = bug_id
         if files:
             self._files = files
-        else:
-            self._files = list(map(lambda f: CommittedFile(self._commit_id, f, '0', '0'), git_commit.stats.files.keys()))
         self._methods = list()
-        self._commit_date = time.mktime(git_commit.committed_datetime.timetuple())
+        self._commit_date = time.mktime(committed_datetime.timetuple())
         self._commit_formatted_date = datetime.utcfromtimestamp(self._commit_date).strftime('%Y-%m-%d %H:%M:%S')
         self.issue = issue
         if issue:
@@ -41,6 +87,18 @@ class Commit(object):
             self.issue_type = ''
         self.is_java_commit = is_java_commit
 
+    def __getattr__(self, name):
+        # the committed files of a commit created without them are read from its diff stats on the first access
+        if name == '_files':
+            self._files = self._read_files()
+            return self._files
+        raise AttributeError(name)
+
+    def _read_files(self):
+        import git
+        git_commit = git.Repo(self._repo_dir).commit(self._commit_id)
+        return list(map(lambda f: CommittedFile(self._commit_id, f, '0', '0'), git_commit.stats.files.keys()))
+
     def is_bug(self):
         return self._issue_id != '0' and self.issue_type == 'bug'
 
@@ -52,13 +110,24 @@ class Commit(object):
     def get_commit_methods(self):
         if self.is_bug():
             if len(self._methods) == 0:
-                self._methods = get_commit_methods(self._repo_dir, self._commit_id, analyze_source_lines=False)
+                self._methods = _read_commit_methods(self._repo_dir, self._commit_id)
         return self._methods
 
     @classmethod
     def init_commit_by_git_commit(cls, git_commit, bug_id=0, issue=None, files=None, is_java_commit=True):
         return Commit(bug_id, git_commit, issue, files=files, is_java_commit=is_java_commit)
 
+    @classmethod
+    def init_commit_by_log(cls, commit_id, repo_dir, committed_datetime, bug_id=0, issue=None, files=None, is_java_commit=True):
+        """
+        a commit from data read in bulk (see git_log.iter_messages), without a GitPython lookup.
+        files are usually taken from the bulk numstat data, without them they are read lazily as for any commit.
+        committed_datetime is in the committer's timezone, as git_commit.committed_datetime.
+        """
+        commit = cls.__new__(cls)
+        commit._init(bug_id, commit_id, repo_dir, committed_datetime, issue, files, is_java_commit)
+        return commit
+
     def to_list(self):
         return [self._commit_id, str(self._issue_id), ";".join(list(map(lambda x: x.name, self._files)))]
 
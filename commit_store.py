@@ -0,0 +1,160 @@
+"""
+a columnar store of the commits of a project and their committed files.
+the shas and the paths are dictionary encoded (a commit is its index, a path is an index into the unique paths),
+dates, insertions and deletions are numpy arrays, so a pickled store is a few arrays instead of an object per file,
+and with the pickle backend the arrays are read back as views of the memory mapped cache file.
+"""
+from datetime import datetime
+
+import numpy as np
+
+from commit import Commit, CommittedFile
+
+
+class CommittedFileView(CommittedFile):
+    """
+    a committed file of a CommitStore, read only.
+    """
+    __slots__ = ('_store', '_commit', '_index')
+
+    def __init__(self, store, commit, index):
+        self._store = store
+        self._commit = commit
+        self._index = index
+
+    @property
+    def sha(self):
+        return self._store.sha(self._commit)
+
+    @property
+    def name(self):
+        return self._store.paths[self._store.file_paths[self._index]]
+
+    @property
+    def insertions(self):
+        return int(self._store.insertions[self._index])
+
+    @property
+    def deletions(self):
+        return int(self._store.deletions[self._index])
+
+    @property
+    def is_java(self):
+        return bool(self._store.paths_is_java[self._store.file_paths[self._index]])
+
+
+class CommitView(Commit):
+    """
+    a commit of a CommitStore. it behaves as the Commit it was built from, only _methods is kept per view.
+    """
+    __slots__ = ('_store', '_index', '_methods')
+
+    def __init__(self, store, index):
+        self._store = store
+        self._index = index
+        self._methods = list()
+
+    @property
+    def _commit_id(self):
+        return self._store.sha(self._index)
+
+    @property
+    def _repo_dir(self):
+        return self._store.repo_dir
+
+    @property
+    def _issue_id(self):
+        return str(self._store.issue_ids[self._index])
+
+    @property
+    def _files(self):
+        start, end = self._store.file_offsets[self._index: self._index + 2]
+        return list(map(lambda i: CommittedFileView(self._store, self._index, i), range(start, end)))
+
+    @property
+    def _commit_date(self):
+        return float(self._store.dates[self._index])
+
+    @property
+    def _commit_formatted_date(self):
+        return datetime.utcfromtimestamp(self._commit_date).strftime('%Y-%m-%d %H:%M:%S')
+
+    @property
+    def issue(self):
+        return self._store.issues.get(self._issue_id)
+
+    @property
+    def issue_type(self):
+        issue = self.issue
+        if issue:
+            return issue.type
+        return ''
+
+    @property
+    def is_java_commit(self):
+        return bool(self._store.is_java_commit[self._index])
+
+
+class CommitStore(object):
+    """
+    a sequence of the commits of a project, as CommitView objects, stored in columns:
+    shas (S40), dates, issue_ids and is_java_commit per commit, file_offsets into the columns of the committed files:
+    file_paths (ids into paths), insertions and deletions. issues are the linked issues by id.
+    """
+    def __init__(self, repo_dir, shas, dates, issue_ids, is_java_commit, file_offsets, file_paths, insertions, deletions,
+                 paths, issues):
+        self.repo_dir = repo_dir
+        self.shas = shas
+        self.dates = dates
+        self.issue_ids = issue_ids
+        self.is_java_commit = is_java_commit
+        self.file_offsets = file_offsets
+        self.file_paths = file_paths
+        self.insertions = insertions
+        self.deletions = deletions
+        self.paths = paths
+        self.paths_is_java = np.fromiter(map(lambda p: p.endswith(".java"), paths), dtype=bool, count=len(paths))
+        self.issues = issues
+
+    @classmethod
+    def from_commits(cls, commits, repo_dir=None):
+        commits = list(commits)
+        paths = {}
+        file_paths, insertions, deletions, file_offsets = [], [], [], [0]
+        for commit in commits:
+            for f in commit._files:
+                file_paths.append(paths.setdefault(f.name, len(paths)))
+                insertions.append(f.insertions)
+                deletions.append(f.deletions)
+            file_offsets.append(len(file_paths))
+        if repo_dir is None:
+            repo_dir = commits[0]._repo_dir if commits else None
+        return cls(repo_dir,
+                   np.array(list(map(lambda c: c._commit_id, commits)), dtype='S40'),
+                   np.fromiter(map(lambda c: c._commit_date, commits), dtype=np.float64, count=len(commits)),
+                   np.array(list(map(lambda c: str(c._issue_id), commits)), dtype=str),
+                   np.fromiter(map(lambda c: c.is_java_commit, commits), dtype=bool, count=len(commits)),
+                   np.array(file_offsets, dtype=np.int64),
+                   np.array(file_paths, dtype=np.int32),
+                   np.array(insertions, dtype=np.int32),
+                   np.array(deletions, dtype=np.int32),
+                   list(paths),
+                   dict(map(lambda c: (str(c._issue_id), c.issue), filter(lambda c: c.issue, commits))))
+
+    def sha(self, index):
+        return self.shas[index].decode('ascii')
+
+    def __len__(self):
+        return len(self.shas)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return list(map(lambda i: CommitView(self, i), range(*index.indices(len(self)))))
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError(index)
+        return CommitView(self, index)
+
+    def __iter__(self):
+        return map(lambda i: CommitView(self, i), range(len(self)))
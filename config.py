@@ -6,11 +6,45 @@ import hashlib
 
 
 class Config:
-    def __init__(self):
+    """
+    config.ini, parsed once per process: Config() always returns the same instance.
+    a value can be overridden by the environment variable REPOSITORY_MINING__<SECTION>__<KEY>,
+    e.g. REPOSITORY_MINING__REPO__REPODIR=/data/apache_repos. call Config.reload() to read config.ini again.
+    """
+    ENV_PREFIX = "REPOSITORY_MINING__"
+    _instance = None
+    loads = 0
+
+    def __new__(cls):
+        if cls._instance is None:
+            instance = super().__new__(cls)
+            instance._load()
+            cls._instance = instance
+        return cls._instance
+
+    def _load(self):
         self.config = configparser.ConfigParser()
         cwd = pathlib.Path(__file__).parent.absolute()
         config_path = cwd.joinpath(r"config.ini")
         self.config.read(config_path)
+        self._apply_env_overrides()
+        Config.loads += 1
+
+    def _apply_env_overrides(self):
+        sections = dict(map(lambda s: (s.upper(), s), self.config.sections()))
+        for name, value in os.environ.items():
+            if not name.upper().startswith(Config.ENV_PREFIX) or name.count("__") != 2:
+                continue
+            section, key = name[len(Config.ENV_PREFIX):].split("__")
+            section = sections.setdefault(section.upper(), section.upper())
+            if not self.config.has_section(section):
+                self.config.add_section(section)
+            self.config[section][key] = value
+
+    @staticmethod
+    def reload():
+        Config._instance = None
+        return Config()
 
     @staticmethod
     def get_temp_path(path=""):
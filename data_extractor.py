@@ -5,17 +5,35 @@ from pathlib import Path
 
 import git
 import json
+import numpy as np
 import pandas as pd
 
 from commit import Commit, CommittedFile
+from commit_store import CommitStore
 from config import Config
 from fixing_issues import VersionInfo
 from issues import get_issues_for_project
 from version_selector import ConfigurationSelectVersion, BinSelectVersion, QuadraticSelectVersion, VersionType, AbstractSelectVersions
-from versions import Version
-from caching import cached
+from versions import Version, tags_java_files
+from caching import cached, read_state, write_state, stable_hash
+from intervals import items_between_versions, assign_intervals
+from git_log import iter_numstat, iter_messages, read_commit_log, read_tag_commits, rev_parse, rev_list, default_ref, is_ancestor
+from tracing import span
 from repo import Repo
 from issues import JiraIssue, BZIssue, Issue
+from issue_linker import IssueLinker
+
+
+def _issues_key(issues):
+    return sorted(map(lambda i: (i.issue_id, i.type, str(i.creation_time)), issues))
+
+
+def _commits_key(commits):
+    return list(map(lambda c: (c._commit_id, c._issue_id), commits))
+
+
+def _versions_key(versions):
+    return list(map(lambda v: v._name, versions))
 
 
 class DataExtractor(object):
@@ -31,6 +49,7 @@ class DataExtractor(object):
         self.bugged_files_between_versions = None
         self.selected_config = self.read_selected_config()
         self.selected_versions = None
+        self.commits_url = None
         self.get_selected_versions()
 
     def set_selected_config(self, val):
@@ -53,22 +72,33 @@ class DataExtractor(object):
         with open(path) as f:
             return int(json.loads(f.read())["selected_config"])
 
-    def checkout_version(self, version):
-        git_repo = git.Repo(self.project.path)
-        version_names = list(map(lambda x: x.name, git_repo.tags))
-        if version.replace('\\', '/') in version_names:
-            git_repo.git.checkout(version.replace('\\', '/'), force=True)
+    def checkout_version(self, version, snapshot_dir=None):
+        """
+        a forced checkout of the tag of version in the clone, or with snapshot_dir an export of its java files
+        to snapshot_dir that leaves the clone as is (see worktrees.export_version).
+        """
+        if snapshot_dir:
+            from worktrees import export_version
+            with span("snapshot", project=self.github_name, version=version) as s:
+                s.set(files=export_version(os.path.abspath(self.project.path), version, snapshot_dir))
+            return
+        with span("checkout", project=self.github_name, version=version):
+            git_repo = git.Repo(self.project.path)
+            version_names = list(map(lambda x: x.name, git_repo.tags))
+            if version.replace('\\', '/') in version_names:
+                git_repo.git.checkout(version.replace('\\', '/'), force=True)
 
     @staticmethod
-    @cached('repo_versions')
+    @cached('repo_versions', fingerprint=True)
     def get_repo_versions(project, repo):
         commits_files = DataExtractor._get_commits_files(project, repo)
         commits_versions = DataExtractor.get_commits_between_versions(repo)
-        tags_commits = dict(map(lambda t: (t.commit, t), repo.tags))
+        tags_commits = dict(map(lambda t: (t.commit.hexsha, t), repo.tags))
+        tags_files = tags_java_files(repo.working_dir, list(map(lambda v: tags_commits[v].name, commits_versions)))
         versions = []
         for v, commits in commits_versions.items():
-            files = reduce(list.__add__, list(map(lambda c: commits_files.get(c.hexsha, []), commits)), [])
-            versions.append(Version(tags_commits[v], files))
+            files = reduce(list.__add__, list(map(lambda c: commits_files.get(c, []), commits)), [])
+            versions.append(Version(tags_commits[v], files, tags_files[tags_commits[v].name]))
         return sorted(versions, key=lambda version: version._commit._commit_date)
 
     def _get_bugged_files_between_versions(self, versions=None, analyze_methods=False):
@@ -80,7 +110,8 @@ class DataExtractor(object):
                                                                    git_repo, analyze_methods)
 
     @staticmethod
-    @cached("bugged_files_all_versions")
+    @cached("bugged_files_all_versions", key_args={'commits': _commits_key, 'versions': _versions_key,
+                                                'quick_mode': None, 'analyze_methods': None}, fingerprint=True)
     def get_bugged_files_all_versions(project, commits, versions, quick_mode, git_repo, analyze_methods=False):
         return DataExtractor.get_bugged_files_between_versions(commits, versions, quick_mode, git_repo, analyze_methods)
 
@@ -98,20 +129,30 @@ class DataExtractor(object):
 
     def init_jira_commits(self):
         git_repo = git.Repo(self.project.path)
-        self.issues = get_issues_for_project(self.project)
-        self.commits = self._commits_and_issues(self.project, git_repo, self.issues)
-        self.versions = self.get_repo_versions(self.project, git_repo)
+        with span("issues", project=self.github_name) as s:
+            self.issues = get_issues_for_project(self.project)
+            s.set(rows=len(self.issues))
+        with span("commits", project=self.github_name) as s:
+            self.commits = self._commits_and_issues(self.project, git_repo, self.issues)
+            s.set(rows=len(self.commits))
+        with span("versions", project=self.github_name) as s:
+            self.versions = self.get_repo_versions(self.project, git_repo)
+            s.set(rows=len(self.versions))
         print("number of commits: ", len(self.commits))
         print("number of tags: ", len(self.versions))
-        self.bugged_files_between_versions = self._get_bugged_files_between_versions()
+        with span("version_intervals", project=self.github_name) as s:
+            self.bugged_files_between_versions = self._get_bugged_files_between_versions()
+            s.set(rows=len(self.bugged_files_between_versions))
 
     def extract(self, selected_versions=False):
-        self._store_issues()
-        self._store_commited_files()
-        self._store_commits()
-        self._store_versions(self.bugged_files_between_versions)
-        self._store_versions_infos(self.bugged_files_between_versions)
-        self._store_files(self.bugged_files_between_versions)
+        with span("store_data", project=self.github_name):
+            self._store_issues()
+            commits_columns, files_columns = self._commits_columns()
+            self._store_commited_files(files_columns)
+            self._store_commits(commits_columns)
+            self._store_versions(self.bugged_files_between_versions)
+            self._store_versions_infos(self.bugged_files_between_versions)
+            self._store_files(self.bugged_files_between_versions)
         if selected_versions:
             tags = self._get_bugged_files_between_versions(list(filter(lambda tag: tag._name in list(map(lambda x: os.path.normpath(str(x)), self.get_selected_versions())), self.versions)), True)
             self._store_versions(tags, True)
@@ -142,24 +183,38 @@ class DataExtractor(object):
         dummies_path = os.path.join(commited_files_dir, self.github_name + "_dummies.csv")
         issues_df.to_csv(dummies_path, index=False, sep=';')
 
-    def _store_commited_files(self):
+    def _commits_columns(self):
+        """
+        the columns of the commits and of their committed files, computed once for _store_commits and _store_commited_files.
+        """
+        store = self.commits if isinstance(self.commits, CommitStore) else CommitStore.from_commits(self.commits)
+        shas = store.shas.astype(str)
+        commits = {"commit_id": shas,
+                   "is_java": store.is_java_commit,
+                   "issue_id": store.issue_ids,
+                   "commit_date": np.asarray(pd.to_datetime(store.dates, unit='s').strftime('%Y-%m-%d %H:%M:%S'), dtype=object),
+                   "commit_url": np.array(self.get_commits_urls(shas), dtype=object),
+                   "bug_url": np.array(list(map(lambda i: store.issues[i].url if i in store.issues else "", store.issue_ids)), dtype=object)}
+        counts = np.diff(store.file_offsets)
+        paths = np.array(store.paths, dtype=object)
+        files = {"file_name": paths[store.file_paths],
+                 "insertions": store.insertions,
+                 "deletions": store.deletions,
+                 "changes": store.insertions.astype(np.int64) + store.deletions,
+                 "is_java": store.paths_is_java[store.file_paths]}
+        files.update(map(lambda c: (c, np.repeat(commits[c], counts)), ["commit_id", "issue_id", "commit_date", "commit_url", "bug_url"]))
+        return commits, files
+
+    def _store_commited_files(self, files_columns):
         columns = ["file_name", "insertions", "deletions", "changes", 'is_java', "commit_id", "issue_id", "commit_date", "commit_url", "bug_url"]
-        commited_files = list(map(lambda c:
-                                  list(map(lambda f:
-                                           [f.name, f.insertions, f.deletions, f.insertions + f.deletions, f.is_java, c._commit_id,
-                                            c._issue_id, c._commit_formatted_date, self.get_commit_url(c._commit_id), c.get_issue_url()],
-                                           c._files)), self.commits))
-
-        commited_files = reduce(list.__add__, commited_files, [])
-        df = pd.DataFrame(commited_files, columns=columns)
+        df = pd.DataFrame(files_columns, columns=columns)
         commited_files_dir = self._get_caching_path("CommittedFiles")
         path = os.path.join(commited_files_dir, self.github_name + ".csv")
         df.to_csv(path, index=False, sep=';')
 
-    def _store_commits(self):
+    def _store_commits(self, commits_columns):
         columns = ["commit_id", 'is_java', "issue_id", "commit_date", "commit_url", "bug_url"]
-        commits = list(map(lambda c: [c._commit_id, c.is_java_commit, c._issue_id, c._commit_formatted_date, self.get_commit_url(c._commit_id), c.get_issue_url()], self.commits))
-        df = pd.DataFrame(commits, columns=columns)
+        df = pd.DataFrame(commits_columns, columns=columns)
         commits_dir = self._get_caching_path("Commits")
         path = os.path.join(commits_dir, self.github_name + ".csv")
         df.to_csv(path, index=False, sep=';')
@@ -167,19 +222,13 @@ class DataExtractor(object):
     def _store_versions(self, tags, selected=False):
         columns = ["version_name", "#commited_files_in_version", "#bugged_files_in_version", "bugged_ratio",
                    "#commits", "#bugged_commits", "#ratio_bugged_commits", "version_date", "version_url", "version_type"]
-        df = pd.DataFrame(columns=columns)
-        for tag in tags:
-            version = {"version_name": tag.version._name,
-                       "#commited_files_in_version": len(tag.version_files),
-                       "#bugged_files_in_version": len(tag.bugged_files),
-                       "bugged_ratio": tag.bugged_ratio,
-                       "#commits": tag.num_commits,
-                       "#bugged_commits": tag.num_bugged_commits,
-                       "#ratio_bugged_commits": tag.ratio_bugged_commits,
-                       "version_date": tag.version._commit._commit_formatted_date,
-                       "version_url": self.get_commit_url(tag.version._commit._commit_id),
-                       "version_type": AbstractSelectVersions.define_version_type(tag.version).version_type.name}
-            df = df.append(version, ignore_index=True)
+        versions = list(map(lambda tag: [tag.version._name, len(tag.version_files), len(tag.bugged_files), tag.bugged_ratio,
+                                         tag.num_commits, tag.num_bugged_commits, tag.ratio_bugged_commits,
+                                         tag.version._commit._commit_formatted_date,
+                                         self.get_commit_url(tag.version._commit._commit_id),
+                                         AbstractSelectVersions.define_version_type(tag.version).version_type.name], tags))
+        # object columns keep the ratios that are 0 written as 0, as the rows appended one by one did
+        df = pd.DataFrame(versions, columns=columns, dtype=object)
         if selected:
             versions_dir = os.path.join(self._get_caching_path("SelectedVersions"), self.github_name)
             Config.assert_dir_exists(versions_dir)
@@ -195,9 +244,18 @@ class DataExtractor(object):
             path = os.path.join(versions_dir, self.github_name + ".csv")
             df[df['version_type'].apply(lambda x: x.lower() in ['minor', 'major'])].to_csv(path, index=False, sep=';')
 
+    def _commits_url(self):
+        # the remote is read once per project, not for every row
+        if self.commits_url is None:
+            git_url = os.path.join(list(git.Repo(self.project.path).remotes[0].urls)[0].replace(".git", ""), "tree")
+            self.commits_url = os.path.normpath(git_url)
+        return self.commits_url
+
     def get_commit_url(self, commit_sha):
-        git_url = os.path.join(list(git.Repo(self.project.path).remotes[0].urls)[0].replace(".git", ""), "tree")
-        return os.path.normpath(os.path.join(git_url, commit_sha))
+        return os.path.normpath(os.path.join(self._commits_url(), commit_sha))
+
+    def get_commits_urls(self, commits_shas):
+        return list(map(lambda sha: os.path.join(self._commits_url(), sha), commits_shas))
 
     def get_versions_by_type(self, v_types=(VersionType.Minor, VersionType.Major)):
         versions = []
@@ -252,26 +310,22 @@ class DataExtractor(object):
 
     @staticmethod
     def _get_commits_between_versions(commits, versions):
-        sorted_versions = sorted(versions, key=lambda version: version._commit._commit_date)
-        sorted_commits_and_versions = sorted(versions + list(filter(lambda x: x.is_java_commit, commits)),
-                                             key=lambda version: version._commit._commit_date if hasattr(version,
-                                                                                                         "_commit") else version._commit_date)
-        versions_indices = list(map(lambda version: (version, sorted_commits_and_versions.index(version)), sorted_versions))
-        selected_versions = list(filter(lambda vers: vers[0][1] < vers[1][1], zip(versions_indices, versions_indices[1:])))
-        return dict(
-            map(lambda vers: (vers[0][0], sorted_commits_and_versions[vers[0][1] + 1: vers[1][1]]), selected_versions))
+        return items_between_versions(versions, list(filter(lambda x: x.is_java_commit, commits)),
+                                      lambda version: version._commit._commit_date if hasattr(version, "_commit") else version._commit_date)
 
     @staticmethod
     def get_commits_between_versions(repo, versions_commits=None):
-        repo_commits = list(repo.iter_commits())
+        """
+        {version sha: [shas of the commits between the version and the next one]}, by committer date.
+        versions_commits are (sha, committer timestamp) pairs, by default the commits of the tags.
+        """
+        log = read_commit_log(repo.working_dir, rev=default_ref(repo.working_dir))
         if versions_commits is None:
-            versions_commits = list(map(lambda x: x.commit, repo.tags))
-        sorted_versions = sorted(versions_commits, key=lambda version: version.committed_datetime)
-        sorted_commits_and_versions = sorted(sorted_versions + repo_commits, key=lambda c: c.committed_datetime)
-        versions_indices = list(map(lambda version: (version, sorted_commits_and_versions.index(version)), sorted_versions))
-        selected_versions = list(filter(lambda vers: vers[0][1] < vers[1][1], zip(versions_indices, versions_indices[1:])))
-        return dict(
-            map(lambda vers: (vers[0][0], sorted_commits_and_versions[vers[0][1] + 1: vers[1][1]]), selected_versions))
+            versions_commits = list(map(lambda t: (t[1], t[2]), read_tag_commits(repo.working_dir)))
+        versions_shas = list(map(lambda v: v[0], versions_commits))
+        shas = versions_shas + log.shas
+        order, intervals = assign_intervals(list(map(lambda v: v[1], versions_commits)), versions_shas, log.committer_dates)
+        return dict(map(lambda i: (shas[i[0]], list(map(lambda ind: shas[ind], order[i[1] + 1: i[2]]))), intervals))
 
     def _get_caching_path(self, config_name):
         config = Config().config
@@ -293,66 +347,84 @@ class DataExtractor(object):
         return ' '.join(commit_message.split())
 
     @staticmethod
-    @cached('commits_and_issues')
+    @cached('commits_and_issues', key_args={'jira_issues': _issues_key}, fingerprint=True)
     def _commits_and_issues(project, repo, jira_issues):
-        issues = dict(map(lambda x: (x.issue_id, x), jira_issues))
-        issues_dates = sorted(list(map(lambda x: (x, issues[x].creation_time), issues)), key=lambda x: x[1], reverse=True)
-        def replace(chars_to_replace, replacement, s):
-            temp_s = s
-            for c in chars_to_replace:
-                temp_s = temp_s.replace(c, replacement)
-            return temp_s
-
-        def get_bug_num_from_comit_text(commit_text, issues_ids):
-            text = replace("[]?#,:(){}'\"", "", commit_text.lower())
-            text = replace("-_.=", " ", text)
-            text = text.replace('bug', '').replace('fix', '')
-            for word in text.split():
-                if word.isdigit():
-                    if word in issues_ids:
-                        return word
-            return "0"
+        linker = IssueLinker(jira_issues)
+
+        # the commits linked by the last run with the same issues are reused, only the new commits are linked
+        issues_key = stable_hash(_issues_key(jira_issues))
+        state = read_state('commits_and_issues', project.github_name)
+        linked = {}
+        if state.get('issues') == issues_key:
+            found, previous = DataExtractor._commits_and_issues.read(state['key'])
+            if found:
+                linked = dict(map(lambda c: (c._commit_id, c), previous))
 
         commits = []
         java_commits = DataExtractor._get_commits_files(project, repo)
+        messages = None
         for commit_sha in java_commits:
-            git_commit = repo.commit(commit_sha)
+            if commit_sha in linked:
+                commits.append(linked[commit_sha])
+                continue
+            if messages is None:
+                # the messages and dates of all the commits in one git log pass, instead of a lookup per commit
+                messages = dict(map(lambda m: (m[0], m[1:]), iter_messages(repo.working_dir, rev=default_ref(repo.working_dir))))
+            committed_datetime, message = messages[commit_sha]
             bug_id = "0"
             if all(list(map(lambda x: not x.is_java, java_commits[commit_sha]))):
-                commit = Commit.init_commit_by_git_commit(git_commit, bug_id, None, java_commits[commit_sha], False)
+                commit = Commit.init_commit_by_log(commit_sha, repo.working_dir, committed_datetime, bug_id, None,
+                                                   java_commits[commit_sha], False)
                 commits.append(commit)
                 continue
             try:
-                commit_text = DataExtractor._clean_commit_message(git_commit.message)
+                commit_text = DataExtractor._clean_commit_message(message)
             except Exception as e:
                 continue
-            ind = 0
-            for ind, (issue_id, date) in enumerate(issues_dates):
-                date_ = date
-                if date_.tzinfo:
-                    date_ = date_.replace(tzinfo=None)
-                if git_commit.committed_datetime.replace(tzinfo=None) > date_:
-                    break
-            issues_dates = issues_dates[ind:]
-            bug_id = get_bug_num_from_comit_text(commit_text, set(map(lambda x: x[0], issues_dates)))
-            commits.append(
-                Commit.init_commit_by_git_commit(git_commit, bug_id, issues.get(bug_id), java_commits[commit_sha]))
-        return commits
+            bug_id = linker.link(commit_text, committed_datetime)
+            commits.append(Commit.init_commit_by_log(commit_sha, repo.working_dir, committed_datetime, bug_id,
+                                                     linker.issues.get(bug_id), java_commits[commit_sha]))
+        write_state('commits_and_issues', project.github_name,
+                    {'issues': issues_key, 'key': DataExtractor._commits_and_issues.cache_key(project, repo, jira_issues)})
+        return CommitStore.from_commits(commits, repo.working_dir)
 
     @staticmethod
-    @cached("commits_files")
-    def _get_commits_files(project, repo):
-        data = repo.git.log('--numstat','--pretty=format:"sha: %H"').split("sha: ")
-        comms = {}
-        for d in data[1:]:
-            d = d.replace('"', '').replace('\n\n', '\n').split('\n')
-            commit_sha = d[0]
-            comms[commit_sha] = []
-            for x in d[1:-1]:
-                insertions, deletions, name = x.split('\t')
-                names = Commit.fix_renamed_files([name])
-                comms[commit_sha].extend(list(map(lambda n: CommittedFile(commit_sha, n, insertions, deletions), names)))
-        return dict(map(lambda x: (x, comms[x]), filter(lambda x: comms[x], comms)))
+    @cached("commits_files", key_args=['pathspec'], fingerprint=True)
+    def _get_commits_files(project, repo, pathspec=None):
+        """
+        the committed files of every commit with files, by sha. pathspec (e.g. ['*.java']) filters the files in git.
+        """
+        def mine(rev):
+            comms = {}
+            for commit_sha, files in iter_numstat(repo.working_dir, rev=rev, pathspec=pathspec):
+                if files:
+                    comms[commit_sha] = list(map(lambda f: CommittedFile(commit_sha, f[2], f[0], f[1]), files))
+            return comms
+
+        # the last mined head of the default branch and the key of its result, a new head only mines last..head.
+        # the default branch does not move when a version is checked out, unlike HEAD
+        state_name = "{0}-{1}".format(project.github_name, stable_hash(pathspec)[:8])
+        state = read_state("commits_files", state_name)
+        branch = default_ref(repo.working_dir)
+        head = rev_parse(repo.working_dir, branch)
+        comms = None
+        last = state.get(branch)
+        if last and is_ancestor(repo.working_dir, last['head'], head):
+            found, previous = DataExtractor._get_commits_files.read(last['key'])
+            if found:
+                comms = mine("{0}..{1}".format(last['head'], head))
+                print("mined {0} new commits of {1} since {2}".format(len(comms), branch, last['head']))
+                comms.update(previous)
+                # a merged branch can bring commits older than the previous ones, the commits are ordered as a full mine
+                # of head lists them
+                comms = dict(map(lambda sha: (sha, comms[sha]), filter(lambda sha: sha in comms,
+                                                                       rev_list(repo.working_dir, head, pathspec))))
+        if comms is None:
+            # first run, or the last head was rewritten (force push, rebase) or its entry evicted
+            comms = mine(head)
+        state[branch] = {'head': head, 'key': DataExtractor._get_commits_files.cache_key(project, repo, pathspec)}
+        write_state("commits_files", state_name, state)
+        return comms
 
     def choose_versions(self, repo=None, version_num=5, configurations=False,
                         algorithm="bin", version_type=VersionType.Untyped, strict=True):
@@ -1,15 +1,17 @@
 from Main import Main
 from projects import ProjectName
 from version_selector import VersionType
+import os
 import sys
 
 
 def extract_all(repo_path):
     m = Main()
-    for proj in ProjectName:
-        if proj.value.github_name.lower() in repo_path.lower():
-            m.set_project_enum(proj.name)
-            break
+    proj = ProjectName.by_github_name(os.path.basename(os.path.normpath(repo_path)))
+    if proj is None:
+        proj = next(filter(lambda p: p.github_name.lower() in repo_path.lower(), ProjectName), None)
+    if proj is not None:
+        m.set_project_enum(proj.name)
     m.choose_versions(version_num=3, algorithm='bin',
                          version_type=VersionType["Untyped"], strict=False)
     m.set_version_selection(version_num=3, algorithm='bin',
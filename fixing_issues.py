@@ -1,5 +1,7 @@
 from functools import reduce
 
+from commit import get_commits_methods
+
 
 class VersionInfo(object):
     def __init__(self, version, commits, repo, analyze_methods=False):
@@ -17,7 +19,7 @@ class VersionInfo(object):
         if self.num_commits:
             self.ratio_bugged_commits = 1.0 * self.num_bugged_commits / self.num_commits
         if analyze_methods:
-            self.committed_methods = reduce(list.__add__, list(map(lambda c: c.get_commit_methods(), commits)), list())
+            self.committed_methods = reduce(list.__add__, get_commits_methods(commits), list())
             self.bugged_methods = list(filter(lambda m: m.changed, self.committed_methods))
             self.version_methods = self.version.get_version_methods(repo)
             self.all_methods = self.committed_methods + self.version_methods
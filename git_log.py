@@ -0,0 +1,331 @@
+"""
+streaming readers of git log output. git runs as a subprocess and its output is parsed while it is read,
+so the memory does not grow with the length of the history, only with what the caller keeps.
+"""
+import os
+import shutil
+import subprocess
+import tempfile
+
+import numpy as np
+
+CHUNK_SIZE = 1 << 20
+RECORD_SEPARATOR = '\x1e'
+
+
+def stream_tokens(args, cwd, sep=b'\0', chunk_size=CHUNK_SIZE, input=None):
+    """
+    runs git with args in cwd and yields its output split by sep, decoded as utf-8. input (bytes) is written to the
+    standard input of git, for the commands that read their arguments from it (--stdin).
+    """
+    stdin = subprocess.PIPE if input is not None else None
+    with subprocess.Popen(['git'] + list(args), cwd=cwd, stdout=subprocess.PIPE, stdin=stdin) as proc:
+        if input is not None:
+            # git reads all its arguments before it writes its output
+            proc.stdin.write(input)
+            proc.stdin.close()
+        pending = b''
+        while True:
+            chunk = proc.stdout.read(chunk_size)
+            if not chunk:
+                break
+            tokens = (pending + chunk).split(sep)
+            pending = tokens.pop()
+            for token in tokens:
+                yield token.decode('utf-8', errors='replace')
+        if pending:
+            yield pending.decode('utf-8', errors='replace')
+        if proc.wait() != 0:
+            raise Exception("Error: git {0} failed in {1}".format(" ".join(args[:2]), cwd))
+
+
+def iter_numstat(repo_dir, rev='HEAD', pathspec=None):
+    """
+    yields (sha, [(insertions, deletions, path), ...]) for every commit reachable from rev, newest first,
+    as `git log --numstat` reports them. renamed files are reported twice, with the old and with the new path.
+    insertions and deletions are strings, '-' for binary files.
+    pathspec (e.g. ['*.java']) is applied by git, which leaves out the commits that do not change matching files.
+    commits without files, such as merges, are reported with no files.
+    """
+    args = ['log', '-z', '--numstat', '--format=tformat:' + RECORD_SEPARATOR + '%H', rev]
+    if pathspec:
+        args.extend(['--'] + list(pathspec))
+    sha = None
+    files = []
+    rename = None
+    for token in stream_tokens(args, repo_dir):
+        if rename is not None:
+            # the paths of a rename follow its counts as two separate tokens
+            rename[2].append(token)
+            if len(rename[2]) == 2:
+                files.extend(map(lambda p: (rename[0], rename[1], p), rename[2]))
+                rename = None
+            continue
+        if token.startswith(RECORD_SEPARATOR):
+            if sha is not None:
+                yield sha, files
+            sha = token[1:]
+            files = []
+            continue
+        token = token.lstrip('\n')
+        if not token:
+            continue
+        insertions, deletions, path = token.split('\t', 2)
+        if path:
+            files.append((insertions, deletions, path))
+        else:
+            rename = (insertions, deletions, [])
+    if sha is not None:
+        yield sha, files
+
+
+class CommitLog(object):
+    """
+    the commits reachable from a revision, newest first, in compact arrays instead of a GitPython Commit per commit:
+    shas and committer_dates (unix timestamps, a numpy int64 array), what the version intervals are computed from.
+    """
+    __slots__ = ('shas', 'committer_dates', '_positions')
+
+    def __init__(self, shas, committer_dates):
+        self.shas = shas
+        self.committer_dates = np.asarray(committer_dates, dtype=np.int64)
+        self._positions = None
+
+    def __len__(self):
+        return len(self.shas)
+
+    def position(self, sha):
+        if self._positions is None:
+            self._positions = dict(map(reversed, enumerate(self.shas)))
+        return self._positions[sha]
+
+
+def read_commit_log(repo_dir, rev='HEAD'):
+    """
+    reads the CommitLog of rev in a single `git log` pass.
+    """
+    shas, committer_dates = [], []
+    for line in stream_tokens(['log', '--format=tformat:%H %ct', rev], repo_dir, sep=b'\n'):
+        sha, committer_date = line.split()
+        shas.append(sha)
+        committer_dates.append(int(committer_date))
+    return CommitLog(shas, committer_dates)
+
+
+def read_tag_commits(repo_dir):
+    """
+    [(tag name, commit sha, committer timestamp of the commit), ...] of the tags of the repository, annotated tags
+    are resolved to their commits. tags of anything but a commit are skipped.
+    """
+    tags = []
+    args = ['for-each-ref', 'refs/tags',
+            '--format=%(refname:strip=2)%00%(objectname)%00%(*objectname)%00%(committerdate:unix)%00%(*committerdate:unix)']
+    for line in stream_tokens(args, repo_dir, sep=b'\n'):
+        name, sha, target, date, target_date = line.split('\0')
+        if date:
+            tags.append((name, sha, int(date)))
+        elif target_date:
+            tags.append((name, target, int(target_date)))
+    return tags
+
+
+def iter_messages(repo_dir, rev='HEAD'):
+    """
+    yields (sha, committed_datetime, message) of every commit reachable from rev, newest first, in one `git log` pass.
+    committed_datetime is in the committer's timezone, the same as GitPython's Commit.committed_datetime.
+    """
+    from git.objects.util import from_timestamp, utctz_to_altz
+    record = []
+    for token in stream_tokens(['log', '-z', '--format=tformat:%H%x00%ct%x00%ci%x00%B', rev], repo_dir):
+        record.append(token)
+        if len(record) < 4:
+            continue
+        sha, committer_date, committer_iso_date, message = record
+        record = []
+        yield sha.lstrip('\n'), from_timestamp(int(committer_date), utctz_to_altz(committer_iso_date.split()[-1])), message
+
+
+def resolve_trees(repo_dir, revs):
+    """
+    the tree ids of revs (e.g. tag names), resolved by one `git cat-file --batch-check`.
+    """
+    out = subprocess.run(['git', 'cat-file', '--batch-check'], cwd=repo_dir, stdout=subprocess.PIPE, check=True,
+                         input="".join(map(lambda r: r + "^{tree}\n", revs)).encode('utf-8')).stdout
+    trees = []
+    for rev, line in zip(revs, out.decode('utf-8').splitlines()):
+        if not line.endswith(" missing") and line.split()[1:2] == ['tree']:
+            trees.append(line.split()[0])
+        else:
+            raise Exception("Error: {0} is not a tree-ish in {1}".format(rev, repo_dir))
+    return trees
+
+
+def ls_tree_paths(repo_dir, rev):
+    """
+    the paths of all the files of rev, quoted as `git ls-tree -r --name-only` prints them.
+    """
+    return subprocess.check_output(['git', 'ls-tree', '-r', '--name-only', rev], cwd=repo_dir).decode('utf-8').splitlines()
+
+
+def tree_changes(repo_dir, pairs):
+    """
+    [(status, path), ...] of the files changed between every (old tree, new tree) pair, renames as deletes and adds.
+    all the pairs are diffed by one `git diff-tree --stdin`, paths are quoted as `git ls-tree` prints them.
+    """
+    out = subprocess.run(['git', 'diff-tree', '--stdin', '--always', '-r', '--no-renames', '--name-status'], cwd=repo_dir,
+                         stdout=subprocess.PIPE, check=True,
+                         input="".join(map(lambda p: "{0} {1}\n".format(*p), pairs)).encode('utf-8')).stdout
+    changes = []
+    for line in out.decode('utf-8').splitlines():
+        if '\t' not in line:
+            # the header of the next pair
+            changes.append([])
+        else:
+            changes[-1].append(tuple(line.split('\t', 1)))
+    return changes
+
+
+def export_tree(repo_dir, rev, out_dir, suffix='.java'):
+    """
+    writes the files of rev whose paths end with suffix under out_dir, as a checkout would write them (through the
+    gitattributes filters), without touching the index or the working tree of repo_dir: rev is read into a temporary
+    index and the files are written from it by one `git checkout-index --prefix`. returns the number of files written.
+    """
+    paths = []
+    for entry in stream_tokens(['ls-tree', '-r', '-z', rev], repo_dir):
+        meta, path = entry.split('\t', 1)
+        if meta.split()[1] == 'blob' and path.endswith(suffix):
+            paths.append(path)
+    index_dir = tempfile.mkdtemp()
+    try:
+        env = dict(os.environ, GIT_INDEX_FILE=os.path.join(index_dir, 'index'))
+        subprocess.check_call(['git', 'read-tree', rev], cwd=repo_dir, env=env)
+        subprocess.run(['git', 'checkout-index', '--force', '-z', '--stdin', '--prefix=' + os.path.join(out_dir, '')],
+                       cwd=repo_dir, env=env, check=True, input="\0".join(paths).encode('utf-8'))
+    finally:
+        shutil.rmtree(index_dir, ignore_errors=True)
+    return len(paths)
+
+
+def iter_blame_incremental(repo_dir, rev, path):
+    """
+    yields (sha, first line, number of lines) for every group of lines of path at rev, the lines are numbered from 1.
+    the groups come in the order `git blame --incremental` finds them, not in the order of the lines.
+    """
+    header = None
+    for line in stream_tokens(['blame', '--incremental', rev, '--', path], repo_dir, sep=b'\n'):
+        if header is None:
+            sha, _, final_line, num_lines = line.split()
+            header = (sha, int(final_line), int(num_lines))
+        elif line.startswith('filename '):
+            # the last line of every group
+            yield header
+            header = None
+
+
+def last_changes(repo_dir, rev, paths):
+    """
+    {path: sha of the last commit that changed it at rev} for paths, the commit `git rev-list -1 rev -- path` gives,
+    for all the paths in two passes: `git log --full-history --parents` limited to paths gives the commits that changed
+    them and the merges, `git diff-tree` the paths a merge changed relative to each of its parents. the history of every
+    path is then simplified as git does: a merge is followed to its first parent with the same path, and is the last
+    change when there is none.
+    """
+    paths = set(paths)
+    if not paths:
+        return {}
+    # --topo-order walks the whole history before the output, a streamed walk can print a commit before its parents are
+    # rewritten (e.g. commits with the same date)
+    args = ['--literal-pathspecs', 'log', '-z', '--name-only', '--no-renames', '--full-history', '--parents',
+            '--topo-order', '--format=tformat:' + RECORD_SEPARATOR + '%H %T %P', '--stdin']
+    # the paths are passed on stdin, a version can have more of them than a command line can hold
+    stdin = "\n".join([rev, '--'] + sorted(paths)) + "\n"
+    order = []
+    trees = {}
+    parents = {}
+    changed = {}
+    for token in stream_tokens(args, repo_dir, input=stdin.encode('utf-8')):
+        if token.startswith(RECORD_SEPARATOR):
+            # the parents are rewritten to the nearest commits of the output, a merge is always in the output
+            ids = token[1:].split()
+            sha = ids[0]
+            order.append(sha)
+            trees[sha] = ids[1]
+            parents[sha] = ids[2:]
+            changed[sha] = set()
+            continue
+        path = token.lstrip('\n')
+        if path:
+            changed[sha].add(path)
+
+    # git log lists no files for a merge, they are diffed with each of their parents
+    merges = set(filter(lambda c: not changed[c], order))
+    pairs = [(m, p) for m in order if m in merges for p in parents[m]]
+    merge_changed = dict(map(lambda pair: (pair, set()), pairs))
+    if pairs:
+        stdin = "".join(map(lambda pair: "{0} {1}\n".format(trees[pair[0]], trees[pair[1]]), pairs))
+        ind = -1
+        for token in stream_tokens(['diff-tree', '-r', '-z', '--name-only', '--no-renames', '--stdin'], repo_dir,
+                                   input=stdin.encode('utf-8')):
+            # every pair of trees starts with its line, the paths follow it
+            lines = token.split('\n')
+            ind += len(lines) - 1
+            if lines[-1] in paths:
+                merge_changed[pairs[ind]].add(lines[-1])
+
+    children = set(p for c in order for p in parents[c])
+    tips = list(filter(lambda c: c not in children, order))
+    commits = {}
+    for path in paths:
+        sha = tips[0] if tips else None
+        while sha is not None:
+            if sha in merges:
+                same = list(filter(lambda p: path not in merge_changed[(sha, p)], parents[sha]))
+                if not same:
+                    break
+                sha = same[0]
+            elif path in changed[sha]:
+                break
+            else:
+                sha = parents[sha][0] if parents[sha] else None
+        if sha is not None:
+            commits[path] = sha
+    return commits
+
+
+def default_ref(repo_dir):
+    """
+    the ref of the default branch: the branch the HEAD of the origin points to (refs/remotes/origin/HEAD), or the checked
+    out branch of a repository without a remote. unlike HEAD it does not move when a version is checked out.
+    """
+    for args in [['symbolic-ref', '-q', 'refs/remotes/origin/HEAD'], ['symbolic-ref', '-q', 'HEAD']]:
+        proc = subprocess.run(['git'] + args, cwd=repo_dir, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL)
+        if proc.returncode == 0:
+            return proc.stdout.decode('utf-8').strip()
+    # a detached checkout without a remote
+    for ref in ['refs/heads/master', 'refs/heads/main']:
+        if subprocess.run(['git', 'rev-parse', '--verify', '-q', ref], cwd=repo_dir, stdout=subprocess.DEVNULL).returncode == 0:
+            return ref
+    return 'HEAD'
+
+
+def rev_parse(repo_dir, rev='HEAD'):
+    return subprocess.check_output(['git', 'rev-parse', rev], cwd=repo_dir).decode('utf-8').strip()
+
+
+def rev_list(repo_dir, rev='HEAD', pathspec=None):
+    """
+    the shas of the commits reachable from rev, in the order `git log` lists them with the same pathspec.
+    """
+    args = ['rev-list', rev]
+    if pathspec:
+        args.extend(['--'] + list(pathspec))
+    return list(stream_tokens(args, repo_dir, sep=b'\n'))
+
+
+def is_ancestor(repo_dir, ancestor, rev='HEAD'):
+    """
+    whether ancestor is reachable from rev. False when ancestor is not in the repository anymore (e.g. after a force push).
+    """
+    return subprocess.run(['git', 'merge-base', '--is-ancestor', ancestor, rev], cwd=repo_dir,
+                          stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL).returncode == 0
@@ -0,0 +1,39 @@
+"""
+assignment of commits to the version intervals they were committed in.
+"""
+import numpy as np
+
+
+def assign_intervals(versions_dates, versions_keys, commits_dates):
+    """
+    the intervals between consecutive versions (by date) in the merged order of the versions and the commits.
+    returns (order, intervals): order are the indices of versions + commits (commit j is len(versions) + j) sorted by date,
+    items of equal date keep their order, versions before commits. intervals are (version index, start, end) for every version
+    with something before the next version, the items between them are order[start + 1: end].
+    versions_keys identify the commit of a version, a version is placed at the first version with its key.
+    this is one stable sort of the dates instead of looking every version up in the sorted list.
+    """
+    dates = np.concatenate([np.asarray(versions_dates, dtype=np.float64), np.asarray(commits_dates, dtype=np.float64)])
+    order = np.argsort(dates, kind='stable')
+    rank = np.empty(len(order), dtype=np.int64)
+    rank[order] = np.arange(len(order))
+    first = {}
+    for ind, key in enumerate(versions_keys):
+        first.setdefault(key, ind)
+    sorted_versions = np.argsort(np.asarray(versions_dates, dtype=np.float64), kind='stable').tolist()
+    positions = list(map(lambda v: int(rank[first[versions_keys[v]]]), sorted_versions))
+    intervals = list(filter(lambda i: i[1] < i[2], map(lambda i: (sorted_versions[i], positions[i], positions[i + 1]),
+                                                        range(len(positions) - 1))))
+    return order, intervals
+
+
+def items_between_versions(versions, commits, date, key=id):
+    """
+    {version: [the versions and commits dated after it and before the next version]}, for every pair of consecutive versions
+    with something between them. date maps a version or a commit to a number, key identifies the commit of a version
+    (id, or the sha when the versions are commits of the history as well).
+    """
+    versions = list(versions)
+    items = versions + list(commits)
+    order, intervals = assign_intervals(list(map(date, versions)), list(map(key, versions)), list(map(date, items[len(versions):])))
+    return dict(map(lambda i: (versions[i[0]], list(map(lambda ind: items[ind], order[i[1] + 1: i[2]]))), intervals))
@@ -0,0 +1,59 @@
+"""
+linking of commit messages to the ids of the issues they fix.
+"""
+import re
+from bisect import bisect_right
+from datetime import datetime, timedelta
+
+# the punctuation removed from a message and the separators replaced by spaces before it is split to words
+MESSAGE_TABLE = dict(list(map(lambda c: (ord(c), None), "[]?#,:(){}'\"")) + list(map(lambda c: (ord(c), " "), "-_.=")))
+NUMBER_WORD = re.compile(r"(?<!\S)[0-9]+(?!\S)")
+EPOCH = datetime(1970, 1, 1)
+MICROSECOND = timedelta(microseconds=1)
+
+
+def _naive(date):
+    if date.tzinfo:
+        return date.replace(tzinfo=None)
+    return date
+
+
+class IssueLinker(object):
+    """
+    links the messages of commits, given from the newest to the oldest, to the issues created before them.
+    the candidates are a window of the issues sorted by creation time, the window only shrinks as older commits are linked.
+    the window start is found by bisect and checked against the position of every issue id, instead of copying the
+    remaining issues and building their ids set for every commit. the links are the same as of the previous scan.
+    """
+    def __init__(self, issues):
+        self.issues = dict(map(lambda x: (x.issue_id, x), issues))
+        issues_dates = sorted(list(map(lambda x: (x, self.issues[x].creation_time), self.issues)), key=lambda x: x[1], reverse=True)
+        self.positions = dict(map(lambda x: (x[1][0], x[0]), enumerate(issues_dates)))
+        self.dates = list(map(lambda x: _naive(x[1]), issues_dates))
+        # the creation times are sorted with their timezones, their naive order can differ around a change of offset
+        self.monotonic = all(map(lambda x: x[0] >= x[1], zip(self.dates, self.dates[1:])))
+        self.keys = list(map(lambda d: -((d - EPOCH) // MICROSECOND), self.dates))
+        self.start = 0
+
+    def _advance(self, committed_datetime):
+        if self.start >= len(self.dates):
+            return
+        date = _naive(committed_datetime)
+        if self.monotonic:
+            ind = bisect_right(self.keys, -((date - EPOCH) // MICROSECOND), self.start)
+        else:
+            ind = next(filter(lambda i: date > self.dates[i], range(self.start, len(self.dates))), len(self.dates))
+        # when no issue is older than the commit the oldest one stays a candidate
+        self.start = min(ind, len(self.dates) - 1)
+
+    def link(self, commit_text, committed_datetime):
+        """
+        the id of the first issue in the window mentioned as a number in commit_text, "0" if there is none.
+        """
+        self._advance(committed_datetime)
+        text = commit_text.lower().translate(MESSAGE_TABLE)
+        text = text.replace('bug', '').replace('fix', '')
+        for word in NUMBER_WORD.findall(text):
+            if self.positions.get(word, -1) >= self.start:
+                return word
+        return "0"
@@ -1,7 +1,5 @@
-import jira
 from caching import cached
 import time
-import bugzilla
 from datetime import datetime
 
 
@@ -70,8 +68,9 @@ class BZIssue(Issue):
             self.fields[k] = ' '.join(self.fields[k].split())
 
 
-@cached("apache_jira")
+@cached("apache_jira", key_args=['url'])
 def get_jira_issues(project_name, url="http://issues.apache.org/jira", bunch=100):
+    import jira
     jira_conn = jira.JIRA(url)
     all_issues=[]
     extracted_issues = 0
@@ -91,8 +90,9 @@ def get_jira_issues(project_name, url="http://issues.apache.org/jira", bunch=100
     return list(map(lambda issue: JiraIssue(issue, url), all_issues))
 
 
-@cached("bugzilla_issues")
+@cached("bugzilla_issues", key_args=['url'])
 def get_bugzilla_issues(product=None, url="bz.apache.org/bugzilla/xmlrpc.cgi"):
+    import bugzilla
     bzapi = bugzilla.Bugzilla(url)
     bugs = []
     sleep_time = 30
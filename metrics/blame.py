@@ -0,0 +1,117 @@
+"""
+blame of the files of a version, for the issues features of ProcessExtractor.
+a blame is cached by the blob of the file, its path and the last commit that changed it, which is the same for all
+the versions where the file did not change, so such a file is blamed once. the files that are not cached yet are blamed
+by a pool of processes.
+"""
+import multiprocessing
+import re
+import subprocess
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
+
+from caching import cached, disable_memory_cache
+from git_log import iter_blame_incremental, last_changes, stream_tokens
+from .commented_code_detector import CommentFilter
+
+WHITESPACE = re.compile(r"\s+")
+
+
+def _porcelain_lines(content):
+    """
+    the lines GitPython's Repo.blame gave for a line of the file (bytes, without the newline), so the features do not
+    change: the line without its trailing whitespace, a carriage return inside the line ends it and the rest is dropped
+    unless it is blank, a part that is not utf-8 is kept as bytes.
+    """
+    lines = []
+    for ind, part in enumerate((b'\t' + content + b'\n').splitlines(True)):
+        try:
+            text = part.rstrip().decode('utf-8')
+        except UnicodeDecodeError:
+            lines.append(part)
+            continue
+        if ind == 0 or WHITESPACE.split(text, 1)[0] == '':
+            lines.append(text[1:] if text.startswith('\t') else text)
+    return lines
+
+
+def blame_lines(repo_dir, rev, path, blob):
+    """
+    [(sha, line), ...] for the lines of path at rev, whose content is blob. the commits come from
+    `git blame --incremental`, the lines from the blob itself.
+    """
+    content = subprocess.check_output(['git', 'cat-file', 'blob', blob], cwd=repo_dir)
+    file_lines = content.split(b'\n')
+    if content.endswith(b'\n') or not content:
+        file_lines.pop()
+    shas = [None] * len(file_lines)
+    for sha, first_line, num_lines in iter_blame_incremental(repo_dir, rev, path):
+        shas[first_line - 1: first_line - 1 + num_lines] = [sha] * num_lines
+    return [(sha, line) for sha, file_line in zip(shas, file_lines) for line in _porcelain_lines(file_line)]
+
+
+@cached('blame', key_args=['path', 'blob', 'commit'])
+def blame_values(project_name, repo_dir, path, blob, commit):
+    """
+    the commit and the halstead metrics of the code of every line of path, blamed at commit, the last commit that changed it.
+    """
+    commits, source_code = list(zip(*blame_lines(repo_dir, commit, path, blob)))
+    lines = CommentFilter().filterComments(source_code)[0]
+    values = []
+    for c, l in zip(commits, lines):
+        d = {"commit_id": c}
+        for k, v in l.getValuesVector().items():
+            d['blame_' + k.replace('Halstead', 'get')] = v
+        values.append(d)
+    return values
+
+
+def _last_commits(repo_dir, rev, paths):
+    """
+    {path: the last commit that changed it at rev}, from git_log.last_changes, the paths it did not resolve are
+    resolved by `git rev-list` one by one.
+    """
+    commits = last_changes(repo_dir, rev, paths)
+    for path in set(paths) - set(commits):
+        commits[path] = subprocess.check_output(['git', 'rev-list', '-1', rev, '--', path], cwd=repo_dir).decode('utf-8').strip()
+    return commits
+
+
+def _get_blobs(repo_dir, rev, paths):
+    paths = set(paths)
+    blobs = {}
+    for entry in stream_tokens(['ls-tree', '-r', '-z', rev], repo_dir):
+        meta, path = entry.split('\t', 1)
+        if path in paths:
+            blobs[path] = meta.split()[2]
+    missing = paths - set(blobs)
+    if missing:
+        raise Exception("Error: {0} are not files of {1} in {2}".format(sorted(missing), rev, repo_dir))
+    return blobs
+
+
+def blame_files(project_name, repo_dir, rev, paths, workers=None):
+    """
+    {path: blame values} of the files at paths at rev. the files that are not cached yet are blamed by workers
+    processes, by default one per cpu, or one inside a worker process (a parallel run of the versions).
+    """
+    blobs = _get_blobs(repo_dir, rev, paths)
+    commits = _last_commits(repo_dir, rev, paths)
+    blames = {}
+    missing = []
+    for path in paths:
+        found, values = blame_values.read(blame_values.cache_key(project_name, repo_dir, path, blobs[path], commits[path]))
+        if found:
+            blames[path] = values
+        else:
+            missing.append(path)
+    if workers is None and multiprocessing.parent_process() is not None:
+        workers = 1
+    if len(missing) > 1 and workers != 1:
+        with ProcessPoolExecutor(max_workers=workers, initializer=disable_memory_cache) as executor:
+            values = executor.map(blame_values, repeat(project_name), repeat(repo_dir), missing,
+                                  map(lambda p: blobs[p], missing), map(lambda p: commits[p], missing))
+            blames.update(zip(missing, values))
+    else:
+        blames.update(map(lambda p: (p, blame_values(project_name, repo_dir, p, blobs[p], commits[p])), missing))
+    return dict(map(lambda p: (p, blames[p]), paths))
@@ -8,6 +8,7 @@ import pandas as pd
 
 from caching import cached
 from config import Config
+from tracing import span
 try:
     from javadiff.javadiff.SourceFile import SourceFile
 except:
@@ -28,7 +29,7 @@ def kill_proc(proc):
 
 def execute_timeout(commands, cwd=None):
     print(commands)
-    with Popen(commands, cwd=cwd) as proc:
+    with span("execute", command=" ".join(commands)), Popen(commands, cwd=cwd) as proc:
         try:
             timer = Timer(TIMEOUT, lambda : kill_proc(proc))
             timer.start()
@@ -58,16 +59,34 @@ class JavaParserFileAnalyser(FileAnalyser):
         self.project_name = project_name
         self.version_name = version_name
         self.outpath = self._get_outpath(project_name, version_name)
-        parser_df = self._get_cached(self.outpath)
+        # the cached paths are relative, so the features are keyed the same whatever the checkout (the clone, a worktree
+        # or a snapshot) the version was parsed and analysed in
+        parser_df = self._get_cached(self.outpath, local_path)
         if parser_df is None:
-            parser_df = self._parse_source_code(local_path, self.outpath)
+            with span("java_parser", project=project_name, version=version_name) as s:
+                parser_df = self._parse_source_code(local_path, self.outpath)
+                s.set(rows=len(parser_df))
         self.parser_df = parser_df
         self.classes_paths = self._get_classes_path()
-        self.relative_paths = dict(map(lambda x: (x.lower().replace(self.local_path.lower() + os.sep, ''), x.lower()), self.parser_df['File Path'].to_list()))
+        self.relative_paths = dict(map(lambda x: (x.lower(), x.lower()), self.parser_df['File Path'].to_list()))
         self.methods_by_path_and_name = self._get_methods_by_path_and_name()
         self.designite_closest_dict = self.get_designite_closest_dict()
         self.closest_id_dict = self.get_closest_id_dict()
 
+    def relative_path(self, path):
+        """
+        path, reported by a tool run on local_path, relative to local_path.
+        """
+        return self._relative_to(path, self.local_path)
+
+    @staticmethod
+    def _relative_to(path, local_path):
+        path = os.path.normpath(str(path))
+        prefix = local_path + os.sep
+        if path.lower().startswith(prefix.lower()):
+            return path[len(prefix):]
+        return path
+
     @staticmethod
     def _get_outpath(project_name, version_name):
         config = Config().config
@@ -83,10 +102,15 @@ class JavaParserFileAnalyser(FileAnalyser):
         return path
 
     @staticmethod
-    def _get_cached(path):
+    def _get_cached(path, local_path):
         if not os.path.exists(path):
             return None
-        return pd.read_csv(path, delimiter=";")
+        parser_df = pd.read_csv(path, delimiter=";")
+        parser_df['File Path'] = parser_df['File Path'].apply(lambda x: JavaParserFileAnalyser._relative_to(x, local_path))
+        if parser_df['File Path'].apply(os.path.isabs).any():
+            # cached with the absolute paths of another checkout, before the paths were stored relative
+            return None
+        return parser_df
 
     @staticmethod
     def _parse_source_code(local_path, cache_path):
@@ -98,7 +122,8 @@ class JavaParserFileAnalyser(FileAnalyser):
         commands = ["java", '-Xmx4096m', "-jar", runner.replace("\\\\?\\", ""), "-i", local_path, "-o", outdir]
         execute_timeout(commands)
         parser_df = pd.read_csv(outpath, delimiter=";")
-        shutil.copyfile(outpath, cache_path)
+        parser_df['File Path'] = parser_df['File Path'].apply(lambda x: JavaParserFileAnalyser._relative_to(x, local_path))
+        parser_df.to_csv(cache_path, sep=';', index=False)
         shutil.rmtree(outdir)
         return parser_df
 
@@ -106,16 +131,13 @@ class JavaParserFileAnalyser(FileAnalyser):
         methods_ans = {}
         for _, file_path, package_name, type_name, method_name, parameters, start_line, end_line in self.parser_df[
             ["File Path", 'Package Name', "Type Name", "Method Name", "Parameters", 'Method Beginning Line', 'Method Ending Line']].itertuples():
-            lower_name = file_path.lower()
-            relative = lower_name.replace(self.local_path.lower() + os.sep, '')
             id = file_path + '@' + package_name + "." + type_name + "." + method_name + parameters
             id = id.lower()
-            methods_ans.setdefault(lower_name, []).append((start_line, end_line, id))
-            methods_ans.setdefault(relative, []).append((start_line, end_line, id))
+            methods_ans.setdefault(file_path.lower(), []).append((start_line, end_line, id))
         return methods_ans
 
     def get_closest_id(self, file_name, line=0):
-        file_name = os.path.normpath(file_name).lower()
+        file_name = self.relative_path(file_name).lower()
         if file_name not in self.closest_id_dict:
             return None
         for start_line, end_line, id in self.closest_id_dict[file_name]:
@@ -130,6 +152,7 @@ class JavaParserFileAnalyser(FileAnalyser):
         return methods_ans
 
     def get_file_path_by_designite(self, file_path, package_name, type_name, method_name=None):
+        file_path = self.relative_path(file_path)
         if method_name is not None:
             return self.designite_closest_dict.get((file_path, package_name, type_name, method_name))
         return file_path
@@ -7,10 +7,10 @@ from datetime import datetime
 import pandas as pd
 import math
 import git
-from functools import reduce
 from collections import Counter
 
 from config import Config
+from tracing import span
 from data_extractor import DataExtractor
 from metrics.rsc import source_monitor_xml
 from metrics.version_metrics_data import (
@@ -21,7 +21,8 @@ from metrics.version_metrics_data import (
     JasomeFilesData, JasomeMethodsData, ProcessData, IssuesProcessData, IssuesProductData, JasomeMoodData, JasomeCKData, JasomeLKData)
 from projects import Project
 from repo import Repo
-from .commented_code_detector import metrics_for_project, CommentFilter
+from .commented_code_detector import metrics_for_project
+from .blame import blame_files
 from metrics.rsc.designite_smells import (
     design_smells_list,
     implementation_smells_list,
@@ -44,7 +45,7 @@ def kill_proc(proc):
 
 def execute_timeout(commands, cwd=None):
     print(commands)
-    with Popen(commands, cwd=cwd) as proc:
+    with span("execute", command=" ".join(commands)), Popen(commands, cwd=cwd) as proc:
         try:
             timer = Timer(TIMEOUT, lambda : kill_proc(proc))
             timer.start()
@@ -71,10 +72,18 @@ class Extractor(ABC):
         self.runner = self._get_runner(self.config, extractor_name)
         if repo is None:
             repo = Repo(project)
-        self.local_path = os.path.realpath(repo.project.path)
+        # git runs in the clone, the sources are read from its checkout or from a snapshot of the version
+        self.repo_path = os.path.realpath(repo.project.path)
+        self.local_path = os.path.realpath(getattr(repo, 'snapshot_dir', None) or repo.project.path)
+        # the outputs of the external tools, a directory per worktree when versions are extracted in parallel
+        self.temp_dir = getattr(repo, 'temp_dir', None)
         self.file_analyser = JavaParserFileAnalyser(self.local_path, self.project_name, self.version)
         self.data: Data = None
 
+    def _get_temp_path(self, name):
+        temp_dir = self.temp_dir or self.config['CACHING']['RepositoryData']
+        return os.path.normpath(Config.get_work_dir_path(os.path.join(temp_dir, self.config['TEMP'][name])))
+
     @staticmethod
     def _get_runner(config, extractor_name):
         if extractor_name not in config['EXTERNALS']:
@@ -105,11 +114,18 @@ class Extractor(ABC):
         self.data.store()
 
     def extract(self):
-        self._set_data()
-        if hasattr(self.data, "path") and os.path.exists(self.data.path):
-            return
-        self._extract()
-        self.store()
+        attributes = {'extractor': self.__class__.__name__, 'project': self.project_name, 'version': self.version}
+        with span("extractor", **attributes) as s:
+            self._set_data()
+            # data stored with the absolute ids of a checkout is extracted again
+            if hasattr(self.data, "path") and self.data.is_stored():
+                s.set(skipped=True)
+                return
+            # the external tools run in "execute" spans, the rest of _extract is processing their output
+            with span("extract", **attributes):
+                self._extract()
+            with span("store", **attributes):
+                self.store()
 
 
     @staticmethod
@@ -159,8 +175,7 @@ class BuggedMethods(Extractor):
 class Checkstyle(Extractor):
     def __init__(self, project: Project, version, repo=None):
         super().__init__("Checkstyle", project, version, [DataType.CheckstyleFileDataType, DataType.CheckstyleMethodDataType], repo)
-        self.out_path_to_xml = os.path.normpath(Config.get_work_dir_path(
-            os.path.join(Config().config['CACHING']['RepositoryData'], Config().config['TEMP']['Checkstyle'])))
+        self.out_path_to_xml = self._get_temp_path('Checkstyle')
 
     def _set_data(self):
         # self.data = CheckstyleData(self.project, self.version)
@@ -241,7 +256,7 @@ class Checkstyle(Extractor):
                 methods_.setdefault(method_id, dict())[key] = value
                 methods_keys.add(key)
             else:
-                files_.setdefault(file_path.lower(), dict())[key] = value
+                files_.setdefault(self.file_analyser.relative_path(file_path).lower(), dict())[key] = value
                 files_keys.add(key)
         return files_, files_keys, methods_, methods_keys
 
@@ -251,8 +266,7 @@ class Designite(Extractor):
         super().__init__("Designite", project, version, [DataType.DesigniteDesignSmellsDataType, DataType.DesigniteImplementationSmellsDataType,
                                                          DataType.DesigniteMethodMetricsDataType, DataType.DesigniteOrganicMethodSmellsDataType,
                                                          DataType.DesigniteTypeMetricsDataType, DataType.DesigniteOrganicTypeSmellsDataType], repo)
-        self.out_dir = os.path.normpath(Config.get_work_dir_path(
-            os.path.join(Config().config['CACHING']['RepositoryData'], Config().config['TEMP']['Designite'])))
+        self.out_dir = self._get_temp_path('Designite')
         Config.assert_dir_exists(self.out_dir)
 
     def _set_data(self):
@@ -384,8 +398,7 @@ class Designite(Extractor):
 class SourceMonitor(Extractor):
     def __init__(self, project: Project, version, repo=None):
         super().__init__("SourceMonitor", project, version, [DataType.SourceMonitorDataType, DataType.SourceMonitorFilesDataType], repo)
-        self.out_dir = os.path.normpath(Config.get_work_dir_path(
-            os.path.join(Config().config['CACHING']['RepositoryData'], Config().config['TEMP']['SourceMonitor'])))
+        self.out_dir = self._get_temp_path('SourceMonitor')
         Config.assert_dir_exists(self.out_dir)
 
 
@@ -467,8 +480,7 @@ class SourceMonitor(Extractor):
 class CK(Extractor):
     def __init__(self, project: Project, version, repo=None):
         super().__init__("CK", project, version, [DataType.CKDataType], repo)
-        self.out_dir = os.path.normpath(Config.get_work_dir_path(
-            os.path.join(Config().config['CACHING']['RepositoryData'], Config().config['TEMP']['CK'])))
+        self.out_dir = self._get_temp_path('CK')
         Config.assert_dir_exists(self.out_dir)
 
     def _set_data(self):
@@ -506,8 +518,7 @@ class CK(Extractor):
 class Mood(Extractor):
     def __init__(self, project: Project, version, repo=None):
         super().__init__("MOOD", project, version, [DataType.MoodDataType], repo)
-        self.out_dir = os.path.normpath(Config.get_work_dir_path(
-            os.path.join(Config().config['CACHING']['RepositoryData'], Config().config['TEMP']['MOOD'])))
+        self.out_dir = self._get_temp_path('MOOD')
         Config.assert_dir_exists(self.out_dir)
 
 
@@ -554,8 +565,7 @@ class Jasome(Extractor):
         super().__init__("Jasome", project, version, [DataType.JasomeFilesDataType,DataType.JasomeCKDataType,
                                                       DataType.JasomeLKDataType,DataType.JasomeMoodDataType,
                                                       DataType.JasomeMethodsDataType], repo)
-        self.out_path_to_xml = os.path.normpath(Config.get_work_dir_path(
-            os.path.join(Config().config['CACHING']['RepositoryData'], Config().config['TEMP']['Jasome'])))
+        self.out_path_to_xml = self._get_temp_path('Jasome')
 
     def _set_data(self):
         self.data = CompositeData()
@@ -643,18 +653,24 @@ class ProcessExtractor(Extractor):
         files = pd.read_csv(path, sep=';')['file_name'].to_list()
         df = df[df.apply(lambda r: r['file_name'].endswith('.java') and r['file_name'] in files, axis=1)]
 
+        files_names = list(filter(lambda f: os.path.normpath(f).lower() in self.file_analyser.relative_paths,
+                                  sorted(set(df['file_name']))))
+        blames = self._get_blame_data(files_names)
         for file_name, file_df in df.groupby('file_name', as_index=False):
             norm_name = os.path.normpath(file_name).lower()
             if norm_name not in self.file_analyser.relative_paths:
                 continue
             name = self.file_analyser.relative_paths[norm_name]
             data[name] = self._extract_process_features(file_df)
-            issues_data[name] = self._extract_issues_features(file_df, issues_df, self._get_blame_data(file_name))
+            issues_data[name] = self._extract_issues_features(file_df, issues_df, blames[file_name])
         # extract the following features:
         self.data.add(ProcessData(self.project, self.version, data=data)).add(IssuesProductData(self.project, self.version, data=issues_data)).add(IssuesProcessData(self.project, self.version, data=issues_data))
 
-    def _get_blame_data(self, file_name):
-        repo = git.Repo(self.local_path)
+    def _get_blame_data(self, files_names):
+        """
+        the blame of every file of files_names at the version, a DataFrame per file name.
+        """
+        repo = git.Repo(self.repo_path)
         version_names = list(map(lambda x: x.name, repo.tags))
         version = self.version
         if version not in version_names:
@@ -664,17 +680,10 @@ class ProcessExtractor(Extractor):
             if '/' in version:
                 if version.replace('/', '\\') in version_names:
                     version = version.replace('/', '\\')
-        blame = repo.blame(version, file_name)
-        blame = reduce(list.__add__, map(lambda x: list(map(lambda y: (x[0], y), x[1])), blame), [])
-        commits, source_code = list(zip(*blame))
-        lines = CommentFilter().filterComments(source_code)[0]
-        values = []
-        for c, l in zip(commits, lines):
-            d = {"commit_id": c.hexsha}
-            for k, v in l.getValuesVector().items():
-                d['blame_' + k.replace('Halstead', 'get')] = v
-            values.append(d)
-        return pd.DataFrame(values)
+        workers = int(self.config['VERSION_METRICS'].get('BlameWorkers', '0')) or None
+        with span("blame", project=self.project_name, version=self.version, files=len(files_names)):
+            blames = blame_files(self.project_name, self.repo_path, version, files_names, workers)
+        return dict(map(lambda f: (f, pd.DataFrame(blames[f])), files_names))
 
     def _get_features(self, d, initial=''):
         ans = {initial + "_count": d.shape[0]}
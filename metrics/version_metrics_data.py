@@ -10,6 +10,7 @@ from config import Config
 from metrics.version_metrics_name import DataNameEnum
 from metrics.version_metrics_name import DataType
 from projects import ProjectName, Project
+from tracing import span
 import gc
 from typing import List
 
@@ -54,6 +55,25 @@ class Data(ABC):
             df['Method_ids'] = df['Method_ids'].apply(os.path.normpath)
         return df
 
+    @staticmethod
+    def _id_columns(columns):
+        return list(filter(lambda c: c in columns, [columns[0], 'Method_ids']))
+
+    def has_absolute_ids(self):
+        """
+        whether the stored data is keyed by the absolute paths of a checkout, as it was stored before the ids were
+        repo-relative. such data does not join the data stored since, it is extracted again.
+        """
+        try:
+            columns = pd.read_csv(self.path, sep=';', nrows=0).columns.tolist()
+        except pd.errors.EmptyDataError:
+            return False
+        ids = pd.read_csv(self.path, sep=';', usecols=self._id_columns(columns), dtype=str)
+        return ids.apply(lambda column: column.dropna().apply(os.path.isabs).any()).any()
+
+    def is_stored(self):
+        return os.path.exists(self.path) and not self.has_absolute_ids()
+
     def set_raw_data(self, raw):
         self.raw_data = raw
         self.data = self._convert_to_df(raw)
@@ -65,6 +85,8 @@ class Data(ABC):
 
     @abstractmethod
     def build(self, values, column_names) -> pd.DataFrame:
+        if self.has_absolute_ids():
+            raise Exception("Error: {0} is keyed by absolute paths, extract it again".format(self.path))
         df = pd.read_csv(self.path, sep=';')
         id = df.columns[0]
         metrics = list(filter(lambda x: x in df.columns, [id] + values))
@@ -549,6 +571,8 @@ class JasomeMethodsData(Data):
 
 class DataBuilder:
     def __init__(self, project: ProjectName, version):
+        self.project = project
+        self.version = version
         self.data_collection = CompositeData().add_all(project, version)
         self.metrics = pd.DataFrame(columns=['data_value', 'data_type', 'data_column'])
 
@@ -567,7 +591,10 @@ class DataBuilder:
         data = self.metrics.groupby('data_type')['data_column'] \
             .apply(lambda x: x.values.tolist()).to_dict()
         column_names = dict(zip(self.metrics['data_column'], self.metrics['data_value']))
-        return self.data_collection.build(data, column_names)
+        with span("build", project=self.project.github_name, version=self.version) as s:
+            classes_df, methods_df = self.data_collection.build(data, column_names)
+            s.set(rows=0 if classes_df is None else len(classes_df), methods_rows=0 if methods_df is None else len(methods_df))
+        return classes_df, methods_df
 
     def __repr__(self):
         self.metrics = self.metrics.drop_duplicates().reset_index(drop=True)
@@ -1,6 +1,5 @@
 import os
-
-import git
+import subprocess
 
 from config import Config
 
@@ -13,12 +12,81 @@ class Repo(object):
             github_user_name = "apache"
         else:
             github_user_name = self.project.github_user
+        self.github_user_name = github_user_name
         github_path = os.path.join(Config().config['REPO']['GithubPath'], github_user_name)
         self.clone_if_needed(github_path)
 
     def clone_if_needed(self, github_path):
         if not os.path.exists(self.project.path):
             git_path = os.path.join(github_path, self.project.github_name + ".git")
-            repo = git.Repo.clone_from(git_path, self.project.path)
-            print("number of commits: ", len(list(repo.iter_commits())))
-            print("number of tags: ", len(list(repo.tags)))
+            self.clone(git_path)
+            if Config().config['REPO'].get('PrintCounts', 'True') == 'True':
+                self.print_counts()
+
+    def get_mirror_path(self):
+        """
+        the bare mirror of the project under MirrorDir, shared by all its clones, None when MirrorDir is not set.
+        """
+        mirror_dir = Config().config['REPO'].get('MirrorDir', '')
+        if not mirror_dir:
+            return None
+        return os.path.abspath(Config.get_work_dir_path(os.path.join(mirror_dir, self.github_user_name,
+                                                                     self.project.github_name + ".git")))
+
+    @staticmethod
+    def get_filter_args():
+        # e.g. blob:none for a blob-less partial clone, the blobs are fetched when they are first read
+        clone_filter = Config().config['REPO'].get('CloneFilter', '')
+        if clone_filter:
+            return ['--filter=' + clone_filter]
+        return []
+
+    def update_mirror(self, git_path):
+        """
+        clones git_path to the mirror of the project, or fetches the new refs to an existing mirror.
+        the clones borrow the objects of the mirror, so its refs are not pruned and its gc does not prune objects:
+        an object of a branch removed from git_path can still be used by a clone.
+        """
+        mirror_path = self.get_mirror_path()
+        if os.path.exists(mirror_path):
+            subprocess.check_call(['git', 'remote', 'update'], cwd=mirror_path)
+        else:
+            Config.assert_dir_exists(os.path.dirname(mirror_path))
+            subprocess.check_call(['git', 'clone', '--mirror'] + self.get_filter_args() + [git_path, mirror_path])
+        for key, value in [('gc.auto', '0'), ('gc.pruneExpire', 'never'), ('fetch.prune', 'false')]:
+            subprocess.check_call(['git', 'config', key, value], cwd=mirror_path)
+        return mirror_path
+
+    def clone(self, git_path):
+        """
+        clones git_path to the path of the project. with a mirror the clone borrows the objects of the mirror:
+        MirrorClone reference fetches from git_path what the mirror lacks (git clone --reference),
+        shared clones the mirror itself (git clone --shared) and keeps git_path as the origin.
+        the clone depends on the mirror in both modes, the mirror must not be removed or pruned of its refs.
+        """
+        if self.get_mirror_path() is None:
+            subprocess.check_call(['git', 'clone'] + self.get_filter_args() + [git_path, self.project.path])
+            return
+        mirror_path = self.update_mirror(git_path)
+        mode = Config().config['REPO'].get('MirrorClone', 'reference')
+        if mode == 'reference':
+            subprocess.check_call(['git', 'clone', '--reference', mirror_path] + self.get_filter_args() +
+                                  [git_path, self.project.path])
+        elif mode == 'shared':
+            subprocess.check_call(['git', 'clone', '--shared', '--no-checkout', mirror_path, self.project.path])
+            # the urls of the commits are built from the origin
+            subprocess.check_call(['git', 'remote', 'set-url', 'origin', git_path], cwd=self.project.path)
+            clone_filter = Config().config['REPO'].get('CloneFilter', '')
+            if clone_filter:
+                # the blobs missing from a partial mirror are fetched from the origin, a local clone does not ask the mirror
+                subprocess.check_call(['git', 'config', 'remote.origin.promisor', 'true'], cwd=self.project.path)
+                subprocess.check_call(['git', 'config', 'remote.origin.partialclonefilter', clone_filter], cwd=self.project.path)
+            subprocess.check_call(['git', 'checkout', '-q'], cwd=self.project.path)
+        else:
+            raise Exception("Error: unknown MirrorClone {0}, use reference or shared".format(mode))
+
+    def print_counts(self):
+        commits = subprocess.check_output(['git', 'rev-list', '--count', 'HEAD'], cwd=self.project.path)
+        tags = subprocess.check_output(['git', 'for-each-ref', '--format=x', 'refs/tags'], cwd=self.project.path)
+        print("number of commits: ", int(commits))
+        print("number of tags: ", len(tags.splitlines()))
@@ -0,0 +1,129 @@
+"""
+the fixtures of the tests: git repositories built in a temporary directory and the config overrides that point the
+code at them.
+"""
+import os
+import subprocess
+import sys
+import tempfile
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+# the cached entries of the modules under test are written out of the tree
+os.environ.setdefault("REPOSITORY_MINING__CACHING__REPOSITORYCACHING", tempfile.mkdtemp(prefix="repository_mining_cache"))
+
+from config import Config
+
+
+IDENTITY = {"GIT_AUTHOR_NAME": "tester", "GIT_COMMITTER_NAME": "tester",
+            "GIT_AUTHOR_EMAIL": "tester@example.com", "GIT_COMMITTER_EMAIL": "tester@example.com"}
+
+
+def git(cwd, *args, env=None):
+    if env is not None:
+        env = dict(os.environ, **env)
+    return subprocess.run(['git'] + list(args), cwd=str(cwd), check=True, stdout=subprocess.PIPE,
+                          env=env).stdout.decode('utf-8').strip()
+
+
+@pytest.fixture(autouse=True)
+def git_identity(monkeypatch):
+    for name, value in IDENTITY.items():
+        monkeypatch.setenv(name, value)
+
+
+@pytest.fixture
+def config(monkeypatch):
+    """
+    sets a value of config.ini for the test, e.g. config('REPO', 'MirrorDir', path), by its environment override.
+    """
+    def set_config(section, key, value):
+        monkeypatch.setenv("{0}{1}__{2}".format(Config.ENV_PREFIX, section, key.upper()), str(value))
+        Config.reload()
+    yield set_config
+    monkeypatch.undo()
+    Config.reload()
+
+
+# the dates of the commits of history, some commits share their second
+START = 1600000000
+
+
+def _dated(date):
+    date = "{0} {1}".format(START + date[0], date[1])
+    return dict(IDENTITY, GIT_AUTHOR_DATE=date, GIT_COMMITTER_DATE=date)
+
+
+def commit_changes(work, message, date, changes=(), tag=None, annotated=False):
+    """
+    commits changes, a list of (path, content) where a None content removes the path and a (new path,) content moves
+    it. date is (seconds after START, timezone).
+    """
+    for path, content in changes:
+        full_path = work.joinpath(path)
+        if content is None:
+            git(work, 'rm', '-q', path)
+        elif isinstance(content, tuple):
+            work.joinpath(content[0]).parent.mkdir(parents=True, exist_ok=True)
+            git(work, 'mv', path, content[0])
+        else:
+            full_path.parent.mkdir(parents=True, exist_ok=True)
+            if isinstance(content, bytes):
+                full_path.write_bytes(content)
+            else:
+                full_path.write_text(content)
+            git(work, 'add', path)
+    env = _dated(date)
+    git(work, 'commit', '-q', '--allow-empty', '-m', message, env=env)
+    if tag:
+        git(work, 'tag', *(['-a', '-m', tag] if annotated else []) + [tag], env=env)
+
+
+@pytest.fixture(scope="session")
+def history(tmp_path_factory):
+    """
+    the path of a repository with the cases the readers of its history handle: java and other files, a binary file, a
+    path with a space, renames, a removed file, a merged branch, commits of the same second and of several timezones,
+    lightweight and annotated tags (two of them on one commit), an evil merge of an older branch, a reverted change
+    and messages that mention issues.
+    """
+    work = tmp_path_factory.mktemp("history")
+    git(work, 'init', '-q')
+    git(work, 'symbolic-ref', 'HEAD', 'refs/heads/master')
+    commit_changes(work, "initial import", (0, "+0000"),
+                   [("src/main/A.java", "class A {}\n"), ("src/main/B.java", "class B {\n  int b;\n}\n"),
+                    ("README.md", "demo\nproject\n")], tag="v1.0")
+    commit_changes(work, "PROJ-1 fix the parser", (100, "+0200"),
+                   [("src/main/A.java", "class A {\n  int a;\n}\n"), ("src/main/My Util.java", "class MyUtil {}\n"),
+                    ("data.bin", b"\x00\x01\x02\x00")])
+    commit_changes(work, "#2: move B", (100, "+0200"), [("src/main/B.java", ("src/core/B.java",))])
+    git(work, 'tag', 'v1.1-alias')
+    commit_changes(work, "(bug 3) document", (150, "-0500"), [("README.md", "demo\nproject\nwith docs\n")],
+                   tag="v1.1", annotated=True)
+    git(work, 'checkout', '-q', '-b', 'side')
+    commit_changes(work, "side work, 3 and 4", (300, "+0000"), [("src/side/C.java", "class C {}\n")])
+    git(work, 'checkout', '-q', 'master')
+    commit_changes(work, "refactor\n\nfix 4 and 5\ngit-svn-id: https://svn.example.com/repos/demo@12 ab-cd", (200, "+0100"),
+                   [("README.md", ("docs/NOTES.txt",)), ("src/main/A.java", "class A {\n  int a, b;\n}\n")], tag="v2.0")
+    git(work, 'tag', 'release-2')
+    git(work, 'merge', '-q', '--no-ff', '-m', "Merge branch 'side'", 'side', env=_dated((400, "+0000")))
+    commit_changes(work, "PROJ-5 remove A", (400, "+0000"),
+                   [("src/main/A.java", None), ("src/side/C.java", "class C {\n  int c;\n}\n")], tag="v3.0", annotated=True)
+    commit_changes(work, "after the last tag, see 6", (500, "+0000"), [("src/core/B.java", "class B {}\n")])
+    # an older branch merged by an evil merge, which also changes a file that neither branch changed
+    git(work, 'checkout', '-q', '-b', 'hotfix', 'v1.1')
+    commit_changes(work, "hotfix the util", (450, "+0300"),
+                   [("src/main/My Util.java", "class MyUtil {\n  int fixed;\n}\n"), ("src/hotfix/D.java", "class D {}\n"),
+                    # the line ends and bytes the blame of GitPython split its own way
+                    ("src/hotfix/Crlf.java", b"class Crlf {  \r\n  int a;\rint b;\r\n \r\n}\r\n"),
+                    ("docs/latin1.txt", b"caf\xe9\nok")])
+    git(work, 'checkout', '-q', 'master')
+    git(work, 'merge', '-q', '--no-ff', '--no-commit', 'hotfix', env=IDENTITY)
+    commit_changes(work, "Merge branch 'hotfix'", (600, "+0000"),
+                   [("docs/NOTES.txt", "demo\nproject\nwith docs\nand a hotfix\n")], tag="v4.0", annotated=True)
+    # a reverted change: the file has the blob of v4.0 again, changed last by another commit
+    commit_changes(work, "try the util", (700, "+0000"), [("src/main/My Util.java", "class MyUtil {\n  int tried;\n}\n")])
+    commit_changes(work, 'Revert "try the util"', (700, "+0000"),
+                   [("src/main/My Util.java", "class MyUtil {\n  int fixed;\n}\n")], tag="v5.0")
+    return str(work)
@@ -0,0 +1,97 @@
+"""
+the blame of the files of a version: git_log.last_changes against `git rev-list -1`, and blame_lines and blame_values
+against the blame of GitPython that the issues features used before.
+"""
+from functools import reduce
+
+import git
+import pytest
+
+from conftest import git as run_git
+from git_log import last_changes
+from metrics.blame import blame_lines, blame_values, blame_files
+from metrics.commented_code_detector import CommentFilter
+
+PROJECT = "demo"
+
+
+def tags(repo_dir):
+    return run_git(repo_dir, 'tag').split()
+
+
+def files(repo_dir, rev):
+    return run_git(repo_dir, 'ls-tree', '-r', '--name-only', rev).splitlines()
+
+
+def text_files(repo_dir, rev):
+    return list(filter(lambda p: p != "data.bin", files(repo_dir, rev)))
+
+
+def blob(repo_dir, rev, path):
+    return run_git(repo_dir, 'rev-parse', "{0}:{1}".format(rev, path))
+
+
+def legacy_blame(repo, rev, path):
+    blame = repo.blame(rev, path)
+    return reduce(list.__add__, map(lambda x: list(map(lambda y: (x[0].hexsha, y), x[1])), blame), [])
+
+
+def legacy_blame_values(repo, rev, path):
+    commits, source_code = list(zip(*legacy_blame(repo, rev, path)))
+    lines = CommentFilter().filterComments(source_code)[0]
+    values = []
+    for c, l in zip(commits, lines):
+        d = {"commit_id": c}
+        for k, v in l.getValuesVector().items():
+            d['blame_' + k.replace('Halstead', 'get')] = v
+        values.append(d)
+    return values
+
+
+def test_last_changes(history):
+    for rev in tags(history) + ['HEAD']:
+        paths = files(history, rev)
+        expected = dict(map(lambda p: (p, run_git(history, 'rev-list', '-1', rev, '--', p)), paths))
+        assert last_changes(history, rev, paths) == expected, rev
+
+
+def test_last_changes_of_merges(history):
+    # the evil merge is the last change of the file it changed, a file of the merged branch is changed last in it
+    merge = run_git(history, 'rev-parse', 'v4.0^{commit}')
+    hotfix = run_git(history, 'rev-parse', 'v4.0^2')
+    assert last_changes(history, 'v4.0', ["docs/NOTES.txt", "src/hotfix/D.java", "src/main/My Util.java"]) == {
+        "docs/NOTES.txt": merge, "src/hotfix/D.java": hotfix, "src/main/My Util.java": hotfix}
+    assert last_changes(history, 'v4.0', []) == {}
+
+
+def test_blame_lines(history):
+    repo = git.Repo(history)
+    for rev in tags(history):
+        for path in text_files(history, rev):
+            assert blame_lines(history, rev, path, blob(history, rev, path)) == legacy_blame(repo, rev, path), (rev, path)
+
+
+def test_blame_values(history):
+    repo = git.Repo(history)
+    for rev in ['v3.0', 'v5.0']:
+        paths = list(filter(lambda p: p.endswith(".java"), files(history, rev)))
+        blames = blame_files(PROJECT, history, rev, paths, workers=1)
+        assert blames == dict(map(lambda p: (p, legacy_blame_values(repo, rev, p)), paths))
+
+
+def test_blame_key_misses_for_another_last_change(history):
+    path = "src/main/My Util.java"
+    # a project of its own, the blames of the other tests are not cached for it
+    project = "demo-revert"
+    # the revert restores the blob of v4.0, the blame of its lines changes to the revert
+    assert blob(history, 'v4.0', path) == blob(history, 'v5.0', path)
+    commits = last_changes(history, 'v4.0', [path])[path], last_changes(history, 'v5.0', [path])[path]
+    assert commits[0] != commits[1]
+    keys = list(map(lambda c: blame_values.cache_key(project, history, path, blob(history, 'v4.0', path), c), commits))
+    assert keys[0] != keys[1]
+    blame_values(project, history, path, blob(history, 'v4.0', path), commits[0])
+    assert blame_values.read(keys[0])[0]
+    assert not blame_values.read(keys[1])[0]
+    values = blame_values(project, history, path, blob(history, 'v5.0', path), commits[1])
+    assert values == legacy_blame_values(git.Repo(history), 'v5.0', path)
+    assert commits[1] in set(map(lambda v: v['commit_id'], values))
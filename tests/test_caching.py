@@ -0,0 +1,95 @@
+"""
+the memory tier of the cache: the LRU eviction by pickled size, its counters and their report as a tracing span,
+and the fingerprint of a repository that keys the entries computed from it.
+"""
+
+import os
+
+import caching
+import tracing
+from caching import MemoryCache, cached, memory_limit, report_memory_cache, repository_fingerprint
+from conftest import git as run_git
+
+
+def test_lru_eviction():
+    cache = MemoryCache(10)
+    cache.put('a', "A", 4)
+    cache.put('b', "B", 4)
+    assert cache.get('a') == (True, "A")
+    # b is the least recently used
+    cache.put('c', "C", 4)
+    assert cache.get('b') == (False, None)
+    assert cache.get('c') == (True, "C")
+    # an entry larger than the tier is not kept
+    cache.put('d', "D", 11)
+    assert cache.get('d') == (False, None)
+    assert cache.stats() == {'entries': 2, 'bytes': 8, 'max_bytes': 10, 'hits': 2, 'misses': 2, 'evictions': 1}
+    cache.resize(4)
+    assert list(cache.entries) == ['c'] and cache.stats()['evictions'] == 2
+    cache.resize(0)
+    assert cache.stats()['entries'] == 0 and cache.total_bytes == 0
+
+
+def test_replaced_entry():
+    cache = MemoryCache(10)
+    cache.put('a', "A", 4)
+    cache.put('a', "AA", 8)
+    assert cache.get('a') == (True, "AA")
+    assert cache.total_bytes == 8 and cache.stats()['evictions'] == 0
+
+
+def test_memory_limit(config):
+    config('CACHING', 'MemoryLimitMB', 300)
+    assert memory_limit(1) == 300 * 1024 * 1024
+    # the main process and 2 workers share the budget
+    assert memory_limit(2) == 100 * 1024 * 1024
+
+
+def test_cached_counters(tmp_path, monkeypatch):
+    monkeypatch.setattr(caching, 'MEMORY_CACHE', MemoryCache(1024 * 1024))
+    calls = []
+
+    @cached('numbers', cache_dir=tmp_path, key_args=['n'])
+    def square(name, n):
+        calls.append(n)
+        return n * n
+
+    assert square("demo", 3) == 9
+    assert square("demo", 3) == 9
+    assert square("demo", 4) == 16
+    assert calls == [3, 4]
+    stats = caching.MEMORY_CACHE.stats()
+    assert (stats['entries'], stats['hits'], stats['misses']) == (2, 1, 2)
+    # a process without a memory tier reads the entry from its file
+    caching.MEMORY_CACHE.resize(0)
+    assert square("demo", 3) == 9
+    assert calls == [3, 4]
+
+
+def test_report_memory_cache(tmp_path, monkeypatch):
+    path = str(tmp_path / "trace.jsonl")
+    monkeypatch.setattr(tracing.TRACER, 'path', path)
+    monkeypatch.setattr(caching, 'MEMORY_CACHE', MemoryCache(10))
+    caching.MEMORY_CACHE.put('a', "A", 4)
+    caching.MEMORY_CACHE.get('a')
+    caching.MEMORY_CACHE.get('b')
+    report_memory_cache(project="demo", version="v1")
+    event, = tracing.read_events(path)
+    assert event['name'] == "memory_cache"
+    assert event['args'] == {'project': "demo", 'version': "v1", 'entries': 1, 'bytes': 4, 'max_bytes': 10,
+                             'hits': 1, 'misses': 1, 'evictions': 0}
+
+
+def test_fingerprint_of_nested_tag(tmp_path):
+    run_git(tmp_path, 'init', '-q')
+    (tmp_path / "A.java").write_text("class A {}\n")
+    run_git(tmp_path, 'add', '-A')
+    run_git(tmp_path, 'commit', '-q', '-m', "a")
+    run_git(tmp_path, 'tag', 'release/1')
+    fingerprint = repository_fingerprint(str(tmp_path))
+    assert repository_fingerprint(str(tmp_path)) == fingerprint
+    # only the mtime of refs/tags/release changes
+    tags_mtime = os.stat(tmp_path / ".git" / "refs" / "tags").st_mtime_ns
+    run_git(tmp_path, 'tag', 'release/2')
+    assert os.stat(tmp_path / ".git" / "refs" / "tags").st_mtime_ns == tags_mtime
+    assert repository_fingerprint(str(tmp_path)) != fingerprint
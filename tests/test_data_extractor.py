@@ -0,0 +1,47 @@
+"""
+the incremental mining of DataExtractor._get_commits_files: mining only the commits since the last mined head gives
+the same result, in the same order, as mining the whole history again.
+"""
+from types import SimpleNamespace
+
+import git
+import pytest
+
+from conftest import commit_changes, git as run_git
+
+pytest.importorskip("javadiff")
+from data_extractor import DataExtractor
+
+
+def work_repo(tmp_path, history, name):
+    path = tmp_path / name
+    run_git(tmp_path, 'clone', '-q', history, str(path))
+    # the default branch is the local master, which the test moves
+    run_git(path, 'remote', 'remove', 'origin')
+    return SimpleNamespace(github_name=name, path=str(path)), git.Repo(str(path))
+
+
+def mined(commits_files):
+    return list(map(lambda c: (c[0], list(map(lambda f: (f.name, f.insertions, f.deletions), c[1]))), commits_files.items()))
+
+
+@pytest.mark.parametrize("pathspec", [None, ['*.java']])
+def test_incremental_mine(tmp_path, history, capsys, pathspec):
+    project, repo = work_repo(tmp_path, history, "incremental")
+    # a branch of an old version, merged after the first mine
+    run_git(project.path, 'checkout', '-q', '-b', 'old', 'v1.1')
+    commit_changes(tmp_path / "incremental", "an old fix", (160, "+0000"), [("src/old/E.java", "class E {}\n")])
+    run_git(project.path, 'checkout', '-q', 'master')
+    first = DataExtractor._get_commits_files(project, repo, pathspec)
+    run_git(project.path, 'merge', '-q', '--no-ff', '-m', "Merge branch 'old'", 'old')
+    commit_changes(tmp_path / "incremental", "after the merge", (900, "+0000"), [("src/old/E.java", "class E { }\n")])
+
+    capsys.readouterr()
+    incremental = DataExtractor._get_commits_files(project, repo, pathspec)
+    assert "mined 2 new commits" in capsys.readouterr().out
+    full_project, full_repo = work_repo(tmp_path, project.path, "full")
+    full = DataExtractor._get_commits_files(full_project, full_repo, pathspec)
+    assert mined(incremental) == mined(full)
+    assert set(incremental) - set(first) == set(run_git(project.path, 'rev-parse', 'old', 'master').split())
+    # the old commit is listed by its date, after the commits mined first
+    assert list(incremental).index(run_git(project.path, 'rev-parse', 'old')) > list(incremental).index(list(first)[0])
@@ -0,0 +1,68 @@
+"""
+git_log.iter_numstat against the GitPython parser of `git log --numstat` that DataExtractor._get_commits_files used
+before it streamed the log.
+"""
+import git
+import pytest
+
+from conftest import git as run_git
+from git_log import iter_numstat, read_commit_log
+
+pytest.importorskip("javadiff")
+from commit import Commit
+
+
+def legacy_commits_files(repo):
+    """
+    {sha: [(path, insertions, deletions), ...]} of the commits with files, as the GitPython parser read them.
+    """
+    data = repo.git.log('--numstat', '--pretty=format:"sha: %H"').split("sha: ")
+    comms = {}
+    for d in data[1:]:
+        d = d.replace('"', '').replace('\n\n', '\n').split('\n')
+        commit_sha = d[0]
+        comms[commit_sha] = []
+        for x in d[1:-1]:
+            insertions, deletions, name = x.split('\t')
+            comms[commit_sha].extend(map(lambda n: (n, insertions, deletions), Commit.fix_renamed_files([name])))
+    return dict(filter(lambda x: x[1], comms.items()))
+
+
+def commits_files(repo_dir, pathspec=None):
+    files = map(lambda c: (c[0], list(map(lambda f: (f[2], f[0], f[1]), c[1]))), iter_numstat(repo_dir, pathspec=pathspec))
+    return dict(filter(lambda x: x[1], files))
+
+
+def test_iter_numstat(history):
+    legacy = legacy_commits_files(git.Repo(history))
+    new = commits_files(history)
+    root = run_git(history, 'rev-list', '--max-parents=0', 'HEAD')
+    # the output of repo.git is stripped, the parser dropped the last line of the log: the last file of the root commit
+    assert new[root][:-1] == legacy.pop(root)
+    assert new.pop(root)[-1] == ("src/main/B.java", "3", "0")
+    assert new == legacy
+
+
+def test_iter_numstat_renames(history):
+    files = sum(map(lambda c: c[1], iter_numstat(history)), [])
+    # a rename is reported by both its paths, with the same counts
+    assert ("0", "0", "README.md") in files and ("0", "0", "docs/NOTES.txt") in files
+    assert ("0", "0", "src/main/B.java") in files and ("0", "0", "src/core/B.java") in files
+    assert ("-", "-", "data.bin") in files
+
+
+def test_iter_numstat_pathspec(history):
+    java = map(lambda x: (x[0], list(filter(lambda f: f[0].endswith(".java"), x[1]))), commits_files(history).items())
+    assert commits_files(history, ['*.java']) == dict(filter(lambda x: x[1], java))
+    # the commit that changed only README.md is left out, the merge is reported without files
+    shas = dict(iter_numstat(history, pathspec=['*.java']))
+    assert run_git(history, 'rev-parse', 'v1.1^{commit}') not in shas
+    assert shas[run_git(history, 'rev-parse', ':/Merge branch')] == []
+
+
+def test_read_commit_log(history):
+    log = read_commit_log(history)
+    repo = git.Repo(history)
+    commits = list(map(lambda c: (c.hexsha, c.committed_date), repo.iter_commits()))
+    assert list(zip(log.shas, log.committer_dates.tolist())) == commits
+    assert log.position(log.shas[3]) == 3 and len(log) == len(log.shas)
@@ -0,0 +1,36 @@
+"""
+the commits between versions, by intervals.assign_intervals, against the list.index assignment of
+DataExtractor.get_commits_between_versions over the GitPython commits that it replaced.
+"""
+import git
+import pytest
+
+from benchmarks.version_intervals import (as_shas, commits_between_versions, legacy_commits_between_versions,
+                                          synthetic_history)
+
+
+def legacy_get_commits_between_versions(repo):
+    repo_commits = list(repo.iter_commits())
+    versions_commits = list(map(lambda x: x.commit, repo.tags))
+    sorted_versions = sorted(versions_commits, key=lambda version: version.committed_datetime)
+    sorted_commits_and_versions = sorted(sorted_versions + repo_commits, key=lambda c: c.committed_datetime)
+    versions_indices = list(map(lambda version: (version, sorted_commits_and_versions.index(version)), sorted_versions))
+    selected_versions = list(filter(lambda vers: vers[0][1] < vers[1][1], zip(versions_indices, versions_indices[1:])))
+    return dict(
+        map(lambda vers: (vers[0][0], sorted_commits_and_versions[vers[0][1] + 1: vers[1][1]]), selected_versions))
+
+
+def test_get_commits_between_versions(history):
+    pytest.importorskip("javadiff")
+    from data_extractor import DataExtractor
+    repo = git.Repo(history)
+    legacy = legacy_get_commits_between_versions(repo)
+    new = DataExtractor.get_commits_between_versions(repo)
+    assert new == dict(map(lambda kv: (kv[0].hexsha, list(map(lambda c: c.hexsha, kv[1]))), legacy.items()))
+    assert any(new.values())
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_items_between_versions(seed):
+    history, tags = synthetic_history(2000, 40, seed=seed)
+    assert as_shas(commits_between_versions(history, tags)) == as_shas(legacy_commits_between_versions(history, tags))
@@ -0,0 +1,45 @@
+"""
+the IssueLinker over the messages of git_log.iter_messages against the previous scan of _commits_and_issues over the
+messages and dates of the GitPython commits.
+"""
+from datetime import datetime, timedelta, timezone
+
+import git
+import pytest
+
+from benchmarks.issue_linking import SyntheticIssue, legacy_links, linker_links, synthetic_data
+from conftest import START
+from git_log import iter_messages
+
+
+def created(seconds, hours=0):
+    return datetime.fromtimestamp(START + seconds, timezone(timedelta(hours=hours)))
+
+
+# the issues mentioned by the messages of history, created before, between and after its commits. 12 is the svn
+# revision of a git-svn-id line, which is cleaned from the message
+ISSUES = [SyntheticIssue("1", created(-1000)), SyntheticIssue("2", created(-50, 2)), SyntheticIssue("3", created(120, -5)),
+          SyntheticIssue("4", created(250)), SyntheticIssue("5", created(50, 1)), SyntheticIssue("6", created(600)),
+          SyntheticIssue("12", created(-2000))]
+
+
+def test_iter_messages(history):
+    commits = list(map(lambda c: (c.hexsha, c.committed_datetime, c.message), git.Repo(history).iter_commits()))
+    assert list(iter_messages(history)) == commits
+
+
+def test_links(history):
+    pytest.importorskip("javadiff")
+    from data_extractor import DataExtractor
+    clean = DataExtractor._clean_commit_message
+    legacy_commits = list(map(lambda c: (clean(c.message), c.committed_datetime), git.Repo(history).iter_commits()))
+    commits = list(map(lambda c: (clean(c[2]), c[1]), iter_messages(history)))
+    links = linker_links(ISSUES, commits)
+    assert links == legacy_links(ISSUES, legacy_commits)
+    assert "0" in links and len(set(links)) > 2
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_synthetic_links(seed):
+    issues, commits = synthetic_data(500, 300, seed=seed)
+    assert linker_links(issues, commits) == legacy_links(issues, commits)
@@ -0,0 +1,136 @@
+"""
+repo.Repo clones of a bare repository at <GithubPath>/<user>/<name>.git, served by a file:// url: full clones,
+clones that borrow the objects of a mirror (reference and shared) and blob-less partial clones.
+"""
+import os
+from types import SimpleNamespace
+
+import pytest
+
+from conftest import git
+from repo import Repo
+
+USER = "apache"
+NAME = "demo"
+
+
+def commit_file(work, content, tag=None):
+    (work / "A.java").write_text(content)
+    git(work, 'add', '-A')
+    git(work, 'commit', '-q', '-m', content.strip())
+    if tag:
+        git(work, 'tag', tag)
+
+
+@pytest.fixture
+def github(tmp_path):
+    """
+    the directory of GithubPath and the work repository pushed to its bare repository: 3 commits, each tagged.
+    """
+    work = tmp_path / "work"
+    work.mkdir()
+    git(work, 'init', '-q')
+    git(work, 'symbolic-ref', 'HEAD', 'refs/heads/master')
+    for i in range(3):
+        commit_file(work, "class A {{ int a = {0}; }}\n".format(i), "v{0}".format(i))
+    bare = tmp_path / "github" / USER / (NAME + ".git")
+    git(tmp_path, 'clone', '-q', '--bare', str(work), str(bare))
+    # a partial clone of a file:// url is served only when the repository allows filters
+    git(bare, 'config', 'uploadpack.allowFilter', 'true')
+    git(work, 'remote', 'add', 'origin', str(bare))
+    return SimpleNamespace(path=tmp_path / "github", work=work, bare=bare)
+
+
+def clone(tmp_path, config, github, mode, clone_filter='', name=NAME):
+    config('REPO', 'GithubPath', "file://" + str(github.path))
+    config('REPO', 'MirrorDir', str(tmp_path / "mirrors") if mode != 'full' else '')
+    config('REPO', 'MirrorClone', mode if mode != 'full' else 'reference')
+    config('REPO', 'CloneFilter', clone_filter)
+    project = SimpleNamespace(github_user=USER, github_name=NAME, path=str(tmp_path / "repos" / name))
+    return Repo(project)
+
+
+def alternates(path):
+    alternates_path = os.path.join(path, ".git", "objects", "info", "alternates")
+    if not os.path.exists(alternates_path):
+        return []
+    with open(alternates_path) as f:
+        return list(map(os.path.realpath, f.read().split()))
+
+
+@pytest.mark.parametrize("clone_filter", ['', 'blob:none'])
+@pytest.mark.parametrize("mode", ['full', 'reference', 'shared'])
+def test_clone(tmp_path, config, github, mode, clone_filter):
+    repo = clone(tmp_path, config, github, mode, clone_filter)
+    path = repo.project.path
+    assert git(path, 'rev-list', '--count', 'HEAD') == "3"
+    assert git(path, 'tag').split() == ["v0", "v1", "v2"]
+    # the urls of the commits are built from the origin, also when the clone is made from the mirror
+    assert git(path, 'remote', 'get-url', 'origin') == "file://" + str(github.bare)
+    assert git(path, 'status', '--porcelain') == ""
+    with open(os.path.join(path, "A.java")) as f:
+        assert f.read() == "class A { int a = 2; }\n"
+    # a blob left out of a partial clone is fetched when it is read
+    assert git(path, 'show', 'v0:A.java') == "class A { int a = 0; }"
+
+    mirror = repo.get_mirror_path()
+    if mode == 'full':
+        assert mirror is None
+        assert alternates(path) == []
+    else:
+        assert mirror == str(tmp_path / "mirrors" / USER / (NAME + ".git"))
+        assert git(mirror, 'rev-parse', '--is-bare-repository') == "true"
+        assert alternates(path) == [os.path.realpath(os.path.join(mirror, "objects"))]
+    if clone_filter:
+        assert git(path, 'config', 'remote.origin.promisor') == "true"
+        assert git(path, 'config', 'remote.origin.partialclonefilter') == clone_filter
+    else:
+        assert git(path, 'config', '--default', '', 'remote.origin.partialclonefilter') == ""
+
+
+@pytest.mark.parametrize("mode", ['reference', 'shared'])
+def test_mirror_is_updated(tmp_path, config, github, mode):
+    clone(tmp_path, config, github, mode, name="first")
+    commit_file(github.work, "class A { int a = 3; }\n", "v3")
+    git(github.work, 'push', '-q', 'origin', 'HEAD:master', 'v3')
+    repo = clone(tmp_path, config, github, mode, name="second")
+    head = git(github.work, 'rev-parse', 'HEAD')
+    assert git(repo.get_mirror_path(), 'rev-parse', 'refs/tags/v3^{commit}') == head
+    assert git(repo.project.path, 'rev-parse', 'HEAD') == head
+
+
+@pytest.mark.parametrize("mode", ['reference', 'shared'])
+def test_mirror_is_not_pruned(tmp_path, config, github, mode):
+    git(github.work, 'checkout', '-q', '-b', 'feature')
+    commit_file(github.work, "class A { int feature; }\n")
+    git(github.work, 'push', '-q', 'origin', 'feature')
+    first = clone(tmp_path, config, github, mode, name="first")
+    feature = git(github.work, 'rev-parse', 'feature')
+    assert git(first.project.path, 'rev-parse', 'refs/remotes/origin/feature') == feature
+
+    git(github.work, 'push', '-q', 'origin', ':feature')
+    mirror = clone(tmp_path, config, github, mode, name="second").get_mirror_path()
+    # the objects of the removed branch stay in the mirror, the first clone borrows them
+    assert git(mirror, 'rev-parse', 'refs/heads/feature') == feature
+    assert git(mirror, 'config', 'gc.pruneExpire') == "never"
+    git(mirror, 'gc', '-q')
+    git(first.project.path, 'fsck', '--no-progress')
+    assert git(first.project.path, 'show', feature + ':A.java') == "class A { int feature; }"
+
+
+def test_print_counts(tmp_path, config, github, capsys):
+    clone(tmp_path, config, github, 'full')
+    out = capsys.readouterr().out
+    assert "number of commits:  3" in out
+    assert "number of tags:  3" in out
+
+
+def test_no_print_counts(tmp_path, config, github, capsys):
+    config('REPO', 'PrintCounts', 'False')
+    clone(tmp_path, config, github, 'full')
+    assert "number of commits" not in capsys.readouterr().out
+
+
+def test_unknown_mirror_clone(tmp_path, config, github):
+    with pytest.raises(Exception, match="unknown MirrorClone"):
+        clone(tmp_path, config, github, 'hardlinks')
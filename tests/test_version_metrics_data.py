@@ -0,0 +1,48 @@
+"""
+the Data stored by the extractors: data keyed by the absolute paths of a checkout, stored before the ids were
+repo-relative, is not reused.
+"""
+from types import SimpleNamespace
+
+import pandas as pd
+import pytest
+
+from metrics.version_metrics_data import HalsteadData, BuggedMethodData
+
+
+@pytest.fixture
+def project(tmp_path, config):
+    config('CACHING', 'RepositoryData', str(tmp_path))
+    return SimpleNamespace(github_name="demo")
+
+
+def store(data, rows):
+    pd.DataFrame(rows).to_csv(data.path, index=False, sep=';')
+    return data
+
+
+def test_relative_ids(project):
+    data = store(HalsteadData(project, "v1"), [{'id': "src/main/a.java", 'value': 1}])
+    assert not data.has_absolute_ids()
+    assert data.is_stored()
+
+
+def test_absolute_ids(project):
+    data = store(HalsteadData(project, "v1"), [{'id': "/work/demo/src/main/a.java", 'value': 1}])
+    assert data.has_absolute_ids()
+    assert not data.is_stored()
+    with pytest.raises(Exception, match="absolute paths"):
+        data.build(['value'], {})
+
+
+def test_absolute_method_ids(project):
+    data = store(BuggedMethodData(project, "v1"), [{'id': "a.java@demo.a.f()", 'Method_ids': "/work/demo/a.java@demo.a.f()"},
+                                                   {'id': None, 'Method_ids': None}])
+    assert data.has_absolute_ids()
+
+
+def test_not_stored(project):
+    data = HalsteadData(project, "v1")
+    assert not data.is_stored()
+    open(data.path, 'w').close()
+    assert not data.has_absolute_ids()
@@ -0,0 +1,31 @@
+"""
+versions.tags_java_files against the java files Version listed by GitPython's ls-tree of every tag.
+"""
+import git
+import pytest
+
+pytest.importorskip("javadiff")
+from versions import tags_java_files
+
+
+def legacy_java_files(repo, tag):
+    return set(filter(lambda x: x.endswith(".java"), repo.git.ls_tree("-r", "--name-only", tag).split()))
+
+
+@pytest.mark.parametrize("order", ['date', 'name', 'reversed'])
+def test_tags_java_files(history, order):
+    repo = git.Repo(history)
+    tags = list(map(lambda t: t.name, sorted(repo.tags, key=lambda t: t.commit.committed_datetime)))
+    if order == 'name':
+        tags.sort()
+    elif order == 'reversed':
+        tags.reverse()
+    tags_files = tags_java_files(history, tags)
+    assert tags_files == dict(map(lambda t: (t, legacy_java_files(repo, t)), tags))
+    # the words of a path with a space are kept as ls-tree listed them, a removed file and the old path of a move are not
+    assert "Util.java" in tags_files["v2.0"] and "src/main/A.java" not in tags_files["v3.0"]
+    assert "src/core/B.java" in tags_files["v1.1"] and "src/main/B.java" not in tags_files["v1.1"]
+
+
+def test_no_tags(history):
+    assert tags_java_files(history, []) == {}
@@ -0,0 +1,120 @@
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager
+
+from config import Config
+
+
+class Span(object):
+    """
+    a timed stage of the pipeline. attributes (project, version, rows, files, ...) are stored as the args of the event.
+    """
+    __slots__ = ('name', 'attributes', 'start')
+
+    def __init__(self, name, attributes):
+        self.name = name
+        self.attributes = attributes
+        self.start = time.time()
+
+    def set(self, **attributes):
+        self.attributes.update(attributes)
+        return self
+
+
+class _DisabledSpan(object):
+    __slots__ = ()
+
+    def set(self, **attributes):
+        return self
+
+
+DISABLED_SPAN = _DisabledSpan()
+
+
+class Tracer(object):
+    """
+    writes the finished spans as JSON lines, one complete ("X") event of the trace event format per line.
+    the events of all the processes writing to the same file are appended to it, the viewer nests them by time.
+    convert the file with `python tracing.py <trace.jsonl>` to load it in chrome://tracing or https://ui.perfetto.dev
+    """
+    def __init__(self, path=None):
+        self.path = path
+        self.lock = threading.Lock()
+
+    @property
+    def enabled(self):
+        return bool(self.path)
+
+    @contextmanager
+    def span(self, name, **attributes):
+        if not self.enabled:
+            yield DISABLED_SPAN
+            return
+        span = Span(name, attributes)
+        try:
+            yield span
+        finally:
+            self._emit(span, time.time())
+
+    def _emit(self, span, end):
+        event = {"name": span.name, "cat": "repository_mining", "ph": "X",
+                 "ts": int(span.start * 1e6), "dur": int((end - span.start) * 1e6),
+                 "pid": os.getpid(), "tid": threading.get_ident(),
+                 "args": dict(map(lambda kv: (kv[0], kv[1] if isinstance(kv[1], (int, float, bool)) else str(kv[1])), span.attributes.items()))}
+        line = json.dumps(event) + "\n"
+        with self.lock:
+            with open(self.path, "a") as f:
+                f.write(line)
+
+
+TRACER = Tracer(Config().config['TRACING'].get('Path') if Config().config.has_section('TRACING') else None)
+
+
+def enable(path):
+    """
+    start writing spans to path (a JSON lines file), None disables the tracing.
+    """
+    TRACER.path = path
+    if path:
+        os.environ[Config.ENV_PREFIX + "TRACING__Path"] = os.path.abspath(path)
+
+
+def span(name, **attributes):
+    """
+    with span("checkout", project=..., version=...) as s:
+        ...
+        s.set(files=len(files))
+    """
+    return TRACER.span(name, **attributes)
+
+
+def read_events(path):
+    with open(path) as f:
+        return list(map(json.loads, filter(lambda l: l.strip(), f)))
+
+
+def main():
+    import argparse
+    parser = argparse.ArgumentParser(description='Summarize a trace and convert it to the trace viewer format')
+    parser.add_argument('trace', help='the JSON lines trace')
+    parser.add_argument('-o', '--out', dest='out', help='the trace viewer json to write, default: <trace>.json')
+    args = parser.parse_args()
+    events = read_events(args.trace)
+    out = args.out or os.path.splitext(args.trace)[0] + ".json"
+    with open(out, "w") as f:
+        json.dump({"traceEvents": events, "displayTimeUnit": "ms"}, f)
+    totals = {}
+    for e in events:
+        total = totals.setdefault(e['name'], [0, 0])
+        total[0] += 1
+        total[1] += e['dur']
+    print("{0:<50} {1:>8} {2:>12}".format("span", "count", "total[s]"))
+    for name, (count, dur) in sorted(totals.items(), key=lambda x: x[1][1], reverse=True):
+        print("{0:<50} {1:>8} {2:>12.3f}".format(name, count, dur / 1e6))
+    print("wrote", out)
+
+
+if __name__ == "__main__":
+    main()
@@ -3,7 +3,6 @@ import re
 import json
 from abc import ABC, abstractmethod
 from itertools import product
-import pandas as pd
 from config import Config
 from enum import Enum
 
@@ -156,6 +155,7 @@ class BinSelectVersion(AbstractSelectVersions):
         return selected
 
     def _store_versions(self, repo):
+        import pandas as pd
         config = Config().config
         repository_data = config["CACHING"]["RepositoryData"]
         selected_versions = config["DATA_EXTRACTION"]["SelectedVersionsBin"]
@@ -235,6 +235,7 @@ class QuadraticSelectVersion(AbstractSelectVersions):
         pass
 
     def _store_versions(self, repo):
+        import pandas as pd
         columns = ["version"]
         values = self.versions_selected
         df = pd.DataFrame(values, columns=columns)
@@ -1,6 +1,9 @@
 from commit import Commit
 from _functools import reduce
+from collections import Counter
 import os
+import sys
+from git_log import resolve_trees, ls_tree_paths, tree_changes
 try:
     from javadiff.javadiff.SourceFile import SourceFile
 except:
@@ -15,12 +18,46 @@ class VersionFile(object):
         self.methods = self.source.methods
 
 
+def _java_words(paths):
+    # the words of the ls-tree listing that end with .java, as Version always split the listing
+    return list(filter(lambda x: x.endswith(".java"), " ".join(paths).split()))
+
+
+def tags_java_files(repo_dir, tags_names):
+    """
+    {tag name: the set of its java files} for tags_names, best given in the order of their dates.
+    the first tag is listed by ls-tree, every other one is the previous set updated by the diff between the two trees,
+    all the diffs are read by one git process. the paths are interned, so the sets of all the tags share them.
+    """
+    if not tags_names:
+        return {}
+    trees = resolve_trees(repo_dir, tags_names)
+    current = Counter(map(sys.intern, _java_words(ls_tree_paths(repo_dir, tags_names[0]))))
+    tags_files = {tags_names[0]: set(current)}
+    for name, changes in zip(tags_names[1:], tree_changes(repo_dir, list(zip(trees, trees[1:])))):
+        for status, path in changes:
+            if status == 'A':
+                current.update(map(sys.intern, _java_words([path])))
+            elif status == 'D':
+                for word in _java_words([path]):
+                    current[word] -= 1
+                    if not current[word]:
+                        del current[word]
+        tags_files[name] = set(current)
+    return tags_files
+
+
 class Version(object):
-    def __init__(self, git_tag, _files):
+    def __init__(self, git_tag, _files, files=None):
+        """
+        files are the java files of the tag (see tags_java_files), by default they are listed by git ls-tree.
+        """
         self._commit = Commit.init_commit_by_git_commit(git_tag.commit, files=[git_tag.name])
         self._name = os.path.normpath(git_tag.name)
         self.committed_files = _files
-        self.files = set(filter(lambda x: x.endswith(".java"), git_tag.commit.repo.git.ls_tree("-r", "--name-only", git_tag.name).split()))
+        if files is None:
+            files = set(filter(lambda x: x.endswith(".java"), git_tag.commit.repo.git.ls_tree("-r", "--name-only", git_tag.name).split()))
+        self.files = files
         self.version_files = None
 
     def get_version_files(self, repo):
@@ -0,0 +1,68 @@
+"""
+populate the project level caches (commits_files, commits_and_issues, repo_versions, apache_jira/bugzilla_issues,
+bugged_files_all_versions) of many projects ahead of the feature extraction.
+usage: python warm.py kafka flink hadoop -w 4
+"""
+import argparse
+import time
+import traceback
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+from projects import ProjectName, get_good_projects
+from tracing import span
+
+
+def warm_project(name, quick_mode=False):
+    """
+    builds the caches of one project exactly as DataExtractor.init_jira_commits does, so Main reads the same entries.
+    returns (name, seconds, number of commits, number of versions, error).
+    """
+    from data_extractor import DataExtractor
+    start = time.time()
+    try:
+        with span("warm", project=name):
+            extractor = DataExtractor(ProjectName[name].value, quick_mode)
+            extractor.init_jira_commits()
+        return name, time.time() - start, len(extractor.commits), len(extractor.versions), None
+    except Exception:
+        return name, time.time() - start, 0, 0, traceback.format_exc()
+
+
+def warm(names, workers=4, quick_mode=False):
+    results = []
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = [executor.submit(warm_project, name, quick_mode) for name in names]
+        for future in as_completed(futures):
+            result = future.result()
+            name, seconds, commits, versions, error = result
+            if error:
+                print("{0} failed after {1:.1f} s\n{2}".format(name, seconds, error))
+            else:
+                print("{0} warmed in {1:.1f} s".format(name, seconds))
+            results.append(result)
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Populate the project level caches of many projects in parallel')
+    parser.add_argument('projects', nargs='*', help='ProjectName names of the projects to warm')
+    parser.add_argument('-g', '--good', dest='good', action='store_true', help='warm all the projects of get_good_projects()')
+    parser.add_argument('-w', '--workers', dest='workers', type=int, default=4, help='number of projects to warm in parallel')
+    parser.add_argument('-q', '--quick_mode', dest='quick_mode', action='store_true', help='quick_mode, as in Main.py')
+    args = parser.parse_args()
+    names = list(args.projects)
+    if args.good:
+        names.extend(map(lambda p: p.name, get_good_projects()))
+    unknown = list(filter(lambda n: n not in ProjectName, names))
+    if unknown:
+        parser.error("unknown projects: {0}".format(", ".join(unknown)))
+    start = time.time()
+    results = warm(list(dict.fromkeys(names)), args.workers, args.quick_mode)
+    print("{0:<30} {1:>10} {2:>10} {3:>10} {4:>8}".format("project", "seconds", "commits", "versions", "status"))
+    for name, seconds, commits, versions, error in sorted(results, key=lambda r: r[1], reverse=True):
+        print("{0:<30} {1:>10.1f} {2:>10} {3:>10} {4:>8}".format(name, seconds, commits, versions, "failed" if error else "ok"))
+    print("warmed {0} projects in {1:.1f} s".format(len(results), time.time() - start))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,127 @@
+"""
+git worktrees of a project, so several versions can be checked out and analysed at the same time.
+the worktrees share the objects of the clone in RepoDir, each has its own checkout and its own directory for the
+temporary outputs of the external tools.
+a worktree can also be a snapshot: a plain directory with only the java files of a version, exported from the clone
+without a checkout (see export_version).
+"""
+import copy
+import os
+import shutil
+import subprocess
+
+from config import Config
+
+
+def tag_name(version):
+    return version.replace('\\', '/')
+
+
+def tag_ref(repo_dir, version):
+    """
+    the ref of the tag of version, None when there is no such tag.
+    """
+    ref = 'refs/tags/' + tag_name(version)
+    if subprocess.run(['git', 'rev-parse', '--verify', '-q', ref], cwd=repo_dir, stdout=subprocess.DEVNULL).returncode == 0:
+        return ref
+    return None
+
+
+def checkout_version(path, version):
+    """
+    a forced checkout of the tag of version in the worktree at path, as DataExtractor.checkout_version does in the clone.
+    """
+    ref = tag_ref(path, version)
+    if ref:
+        subprocess.check_call(['git', 'checkout', '--force', '--detach', ref], cwd=path,
+                              stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+
+
+def export_version(repo_dir, version, path):
+    """
+    replaces the content of path by the java files of the tag of version in the clone at repo_dir. the index and the
+    working tree of the clone are not touched. without such a tag the checked out commit is exported, as
+    checkout_version keeps the current checkout.
+    """
+    from git_log import export_tree
+    shutil.rmtree(path, ignore_errors=True)
+    Config.assert_dir_exists(path)
+    return export_tree(repo_dir, tag_ref(repo_dir, version) or 'HEAD', path)
+
+
+def get_snapshots_dir(project):
+    return os.path.abspath(Config.get_work_dir_path(os.path.join(Config().config['REPO']['SnapshotsDir'], project.github_name)))
+
+
+def snapshot_repo(project, path, temp_dir=None):
+    """
+    a repo.Repo of the project whose sources are read from the snapshot at path, for the extractors.
+    git is still run in the clone of the project.
+    """
+    from repo import Repo
+    repo = Repo(project)
+    repo.snapshot_dir = path
+    repo.temp_dir = temp_dir
+    return repo
+
+
+class WorktreePool(object):
+    """
+    size worktrees of project under <WorktreesDir>/<github_name>, created on first use and reused between runs.
+    with snapshots the worktrees are snapshot directories under <SnapshotsDir>/<github_name>.
+    """
+    def __init__(self, project, size, root=None, snapshots=False):
+        self.project = project
+        self.snapshots = snapshots
+        if root is None:
+            if snapshots:
+                root = get_snapshots_dir(project)
+            else:
+                root = os.path.join(Config.get_work_dir_path(Config().config['REPO']['WorktreesDir']), project.github_name)
+        self.root = os.path.abspath(root)
+        self.paths = list(map(lambda i: os.path.join(self.root, str(i)), range(size)))
+
+    def create(self):
+        repo_dir = os.path.abspath(self.project.path)
+        if not self.snapshots:
+            # forget the worktrees whose directories were removed
+            subprocess.check_call(['git', 'worktree', 'prune'], cwd=repo_dir)
+        for path in self.paths:
+            if self.snapshots:
+                Config.assert_dir_exists(path)
+            elif not os.path.exists(os.path.join(path, '.git')):
+                subprocess.check_call(['git', 'worktree', 'add', '--force', '--detach', path], cwd=repo_dir,
+                                      stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+            Config.assert_dir_exists(self.temp_dir(path))
+        return self
+
+    def checkout(self, path, version):
+        if self.snapshots:
+            export_version(os.path.abspath(self.project.path), version, path)
+        else:
+            checkout_version(path, version)
+
+    def temp_dir(self, path):
+        # outside of the worktree, the tools analyse everything under it
+        return os.path.join(self.root, "tmp", os.path.basename(path))
+
+    def repo(self, path):
+        """
+        a repo.Repo of the project checked out at path, for the extractors.
+        """
+        if self.snapshots:
+            return snapshot_repo(self.project, path, self.temp_dir(path))
+        from repo import Repo
+        project = copy.copy(self.project)
+        project.path = path
+        repo = Repo(project)
+        repo.temp_dir = self.temp_dir(path)
+        return repo
+
+    def remove(self):
+        repo_dir = os.path.abspath(self.project.path)
+        for path in self.paths:
+            if self.snapshots:
+                shutil.rmtree(path, ignore_errors=True)
+            elif os.path.exists(path):
+                subprocess.check_call(['git', 'worktree', 'remove', '--force', path], cwd=repo_dir)